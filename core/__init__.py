@@ -3,45 +3,50 @@ OpenClip Core Modules
 
 This package contains all the core functionality for video processing,
 analysis, and clip generation.
+
+Submodules are imported on first attribute access, so importing a light
+module such as core.config does not pull in yt-dlp, MoviePy or PIL.
 """
 
-from .downloaders import ImprovedBilibiliDownloader, DownloadProcessor, VideoDownloader, YouTubeDownloader
-from .video_splitter import VideoSplitter
-from .transcript_generation_whisper import TranscriptProcessor
-from .engaging_moments_analyzer import EngagingMomentsAnalyzer
-from .llm.qwen_api_client import QwenAPIClient
-from .llm.openrouter_api_client import OpenRouterAPIClient
-from .clip_generator import ClipGenerator
-from .title_adder import TitleAdder
-from .cover_image_generator import CoverImageGenerator
-from .video_utils import (
-    VideoFileValidator,
-    VideoFileManager,
-    ProgressCallbackManager,
-    ProcessingResult,
-    ResultsFormatter,
-    process_local_video_file,
-    find_existing_download
-)
-
-__all__ = [
-    'ImprovedBilibiliDownloader',
-    'DownloadProcessor',
-    'VideoDownloader',
-    'YouTubeDownloader',
-    'VideoSplitter',
-    'TranscriptProcessor',
-    'EngagingMomentsAnalyzer',
-    'QwenAPIClient',
-    'OpenRouterAPIClient',
-    'ClipGenerator',
-    'TitleAdder',
-    'CoverImageGenerator',
-    'VideoFileValidator',
-    'VideoFileManager',
-    'ProgressCallbackManager',
-    'ProcessingResult',
-    'ResultsFormatter',
-    'process_local_video_file',
-    'find_existing_download',
-]
+from importlib import import_module
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    'ImprovedBilibiliDownloader': '.downloaders',
+    'DownloadProcessor': '.downloaders',
+    'VideoDownloader': '.downloaders',
+    'YouTubeDownloader': '.downloaders',
+    'VideoSplitter': '.video_splitter',
+    'TranscriptProcessor': '.transcript_generation_whisper',
+    'EngagingMomentsAnalyzer': '.engaging_moments_analyzer',
+    'QwenAPIClient': '.llm.qwen_api_client',
+    'OpenRouterAPIClient': '.llm.openrouter_api_client',
+    'ClipGenerator': '.clip_generator',
+    'TitleAdder': '.title_adder',
+    'CoverImageGenerator': '.cover_image_generator',
+    'StageCache': '.stage_cache',
+    'VideoFileValidator': '.video_utils',
+    'VideoFileManager': '.video_utils',
+    'ProgressCallbackManager': '.video_utils',
+    'FileNameSanitizer': '.video_utils',
+    'ProcessingResult': '.video_utils',
+    'ResultsFormatter': '.video_utils',
+    'process_local_video_file': '.video_utils',
+    'find_existing_download': '.video_utils',
+    'load_json_file': '.video_utils',
+    'write_json_file': '.video_utils',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
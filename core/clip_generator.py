@@ -2,34 +2,80 @@
 """
 Clip Generator - Extract engaging video clips from analyzed moments
 """
-import json
+import os
 import subprocess
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+
+from core.video_utils import load_json_file, FileNameSanitizer
+from core.config import CLIP_WORKERS, CLIP_STREAM_COPY
 
 logger = logging.getLogger(__name__)
 
+# Hidden sub-folder of the clips directory holding each clip's first frame
+FRAMES_DIR_NAME = ".frames"
+
+
+def clip_frame_path(clip_path) -> Path:
+    """Path of the first-frame image written alongside a clip (used as the cover source)"""
+    clip_path = Path(clip_path)
+    return clip_path.parent / FRAMES_DIR_NAME / f"{clip_path.stem}.png"
+
+
+def _list_files(directory: Path, suffix: str) -> Tuple[str, ...]:
+    """Names of non-hidden files in directory ending with suffix, in scandir order (empty if unreadable)"""
+    try:
+        with os.scandir(directory) as entries:
+            return tuple(
+                entry.name for entry in entries
+                if entry.name.endswith(suffix) and not entry.name.startswith('.')
+                and entry.is_file()
+            )
+    except OSError:
+        return ()
+
+
+def _find_part_file(directory: Path, names: Tuple[str, ...], video_part: str, suffix: str) -> Optional[str]:
+    """Match *_{part}{suffix}, then {part}{suffix}, then any *{suffix} (single-file fallback) among names"""
+    part_suffix = f"_{video_part}{suffix}"
+    for name in names:
+        if name.endswith(part_suffix):
+            return str(directory / name)
+    
+    exact_name = f"{video_part}{suffix}"
+    if exact_name in names:
+        return str(directory / exact_name)
+    
+    return str(directory / names[0]) if names else None
+
 
 class ClipGenerator:
     """Generate video clips from engaging moments analysis"""
     
-    def __init__(self, output_dir: str = "engaging_clips"):
+    def __init__(self, output_dir: str = "engaging_clips", max_workers: int = CLIP_WORKERS,
+                 stream_copy: bool = CLIP_STREAM_COPY):
         """
         Initialize clip generator
         
         Args:
             output_dir: Directory to save generated clips
+            max_workers: Number of clips extracted concurrently
+            stream_copy: Copy the source streams instead of re-encoding (keyframe-aligned starts)
         """
         self.output_dir = Path(output_dir)
+        self.max_workers = max(1, max_workers)
+        self.stream_copy = stream_copy
         self.output_dir.mkdir(exist_ok=True)
         logger.info(f"📁 Clip output directory: {self.output_dir}")
     
     def generate_clips_from_analysis(self, 
                                     analysis_file: str,
                                     video_dir: str,
-                                    subtitle_dir: Optional[str] = None) -> Dict[str, Any]:
+                                    subtitle_dir: Optional[str] = None,
+                                    output_dir: Optional[str] = None) -> Dict[str, Any]:
         """
         Generate clips from engaging moments analysis
         
@@ -37,98 +83,50 @@ class ClipGenerator:
             analysis_file: Path to top_engaging_moments.json
             video_dir: Directory containing source video files
             subtitle_dir: Directory containing subtitle files (optional)
+            output_dir: Directory for this run's clips (defaults to the generator's output_dir)
             
         Returns:
             Dictionary with generation results
         """
         try:
             # Load analysis data
-            with open(analysis_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json_file(analysis_file)
             
             video_dir = Path(video_dir)
             subtitle_dir = Path(subtitle_dir) if subtitle_dir else video_dir
+            output_dir = Path(output_dir) if output_dir else self.output_dir
             
             logger.info("🎬 Generating clips from Top Engaging Moments")
-            logger.info(f"📁 Output: {self.output_dir}")
+            logger.info(f"📁 Output: {output_dir}")
             logger.info(f"📝 Subtitle directory: {subtitle_dir}")
             
-            clips_info = []
-            successful_clips = 0
-            
-            # Process each engaging moment
-            for moment in data['top_engaging_moments']:
-                rank = moment['rank']
-                title = moment['title']
-                video_part = moment['timing']['video_part']
-                start_time = moment['timing']['start_time']
-                end_time = moment['timing']['end_time']
-                duration = moment['timing']['duration']
-                
-                logger.info(f"[Rank {rank}] Processing: {title}")
-                
-                # Get source video file
-                input_video = self._find_video_file(video_part, video_dir)
-                if not input_video:
-                    logger.warning(f"✗ Skipping rank {rank}: Video file not found")
-                    continue
-                
-                # Create output filename
-                safe_title = self._sanitize_filename(title)
-                output_filename = f"rank_{rank:02d}_{safe_title}.mp4"
-                output_path = self.output_dir / output_filename
-                
-                # Create the clip
-                success = self._create_clip(
-                    input_video,
-                    start_time,
-                    end_time,
-                    str(output_path),
-                    title
-                )
-                
-                if success:
-                    # Generate subtitle file for the clip
-                    subtitle_filename = f"rank_{rank:02d}_{safe_title}.srt"
-                    subtitle_path = self.output_dir / subtitle_filename
-                    subtitle_generated = self._extract_subtitle_for_clip(
-                        video_part,
-                        start_time,
-                        end_time,
-                        str(subtitle_path),
-                        subtitle_dir
-                    )
-                    
-                    successful_clips += 1
-                    clips_info.append({
-                        'rank': rank,
-                        'title': title,
-                        'filename': output_filename,
-                        'subtitle_filename': subtitle_filename if subtitle_generated else None,
-                        'duration': duration,
-                        'video_part': video_part,
-                        'time_range': f"{start_time} - {end_time}",
-                        'engagement_level': moment['engagement_details'].get('engagement_level', 'N/A'),
-                        'why_engaging': moment['why_engaging']
-                    })
-                    logger.info(f"✓ Saved: {output_filename}")
-                    if subtitle_generated:
-                        logger.info(f"✓ Subtitle: {subtitle_filename}")
-                    else:
-                        logger.info(f"⚠ No subtitle generated for this clip")
-                else:
-                    logger.error(f"✗ Failed: {output_filename}")
+            # Each clip is an independent ffmpeg run, so extract them concurrently;
+            # map() keeps the results in rank order
+            moments = data['top_engaging_moments']
+            (output_dir / FRAMES_DIR_NAME).mkdir(parents=True, exist_ok=True)
+            # List the source directories once per call; every moment matches against these
+            video_names = _list_files(video_dir, ".mp4")
+            subtitle_names = _list_files(subtitle_dir, ".srt")
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                results = list(executor.map(
+                    lambda moment: self._process_moment(
+                        moment, video_dir, subtitle_dir, output_dir, video_names, subtitle_names
+                    ),
+                    moments
+                ))
+            clips_info = [clip for clip in results if clip]
+            successful_clips = len(clips_info)
             
             # Create summary
             if clips_info:
-                self._create_summary(clips_info, data)
+                self._create_summary(clips_info, data, output_dir)
             
             result = {
                 'success': successful_clips > 0,
                 'total_clips': len(data['top_engaging_moments']),
                 'successful_clips': successful_clips,
                 'clips_info': clips_info,
-                'output_dir': str(self.output_dir)
+                'output_dir': str(output_dir)
             }
             
             logger.info(f"🎯 Generated {successful_clips}/{len(data['top_engaging_moments'])} clips")
@@ -144,38 +142,87 @@ class ClipGenerator:
                 'clips_info': []
             }
     
-    def _find_video_file(self, video_part: str, video_dir: Path) -> Optional[str]:
-        """Find video file for a given part"""
-        # Try common patterns
-        patterns = [
-            f"*_{video_part}.mp4",
-            f"{video_part}.mp4",
-            "*.mp4"  # Fallback for single video
-        ]
+    def _process_moment(self, moment: Dict[str, Any], video_dir: Path,
+                        subtitle_dir: Path, output_dir: Path,
+                        video_names: Tuple[str, ...], subtitle_names: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+        """Cut the clip and its subtitle for one moment; returns clip info or None"""
+        rank = moment['rank']
+        title = moment['title']
+        video_part = moment['timing']['video_part']
+        start_time = moment['timing']['start_time']
+        end_time = moment['timing']['end_time']
+        duration = moment['timing']['duration']
         
-        for pattern in patterns:
-            matches = list(video_dir.glob(pattern))
-            if matches:
-                return str(matches[0])
+        logger.info(f"[Rank {rank}] Processing: {title}")
         
-        return None
-    
-    def _find_subtitle_file(self, video_part: str, subtitle_dir: Path) -> Optional[str]:
-        """Find subtitle file for a given part"""
-        # Try common patterns
-        patterns = [
-            f"*_{video_part}.srt",
-            f"{video_part}.srt",
-            "*.srt"  # Fallback for single subtitle
-        ]
+        # Get source video file
+        input_video = self._find_video_file(video_part, video_dir, video_names)
+        if not input_video:
+            logger.warning(f"✗ Skipping rank {rank}: Video file not found")
+            return None
+        
+        # Create output filename
+        safe_title = self._sanitize_filename(title)
+        output_filename = f"rank_{rank:02d}_{safe_title}.mp4"
+        output_path = output_dir / output_filename
+        
+        # Create the clip (and its first frame for the cover in the same ffmpeg run).
+        # A stream-copied clip starts on the keyframe before start_time, so a frame
+        # decoded at start_time would not be its first; covers then read the clip itself
+        frame_path = clip_frame_path(output_path)
+        if self.stream_copy:
+            frame_path.unlink(missing_ok=True)  # drop a frame left by an earlier re-encoded cut
+        success = self._create_clip(
+            input_video,
+            start_time,
+            end_time,
+            str(output_path),
+            title,
+            frame_path=None if self.stream_copy else str(frame_path)
+        )
         
-        for pattern in patterns:
-            matches = list(subtitle_dir.glob(pattern))
-            if matches:
-                return str(matches[0])
+        if success:
+            # Generate subtitle file for the clip
+            subtitle_filename = f"rank_{rank:02d}_{safe_title}.srt"
+            subtitle_path = output_dir / subtitle_filename
+            subtitle_generated = self._extract_subtitle_for_clip(
+                video_part,
+                start_time,
+                end_time,
+                str(subtitle_path),
+                subtitle_dir,
+                subtitle_names
+            )
+            
+            clip_info = {
+                'rank': rank,
+                'title': title,
+                'filename': output_filename,
+                'subtitle_filename': subtitle_filename if subtitle_generated else None,
+                'duration': duration,
+                'video_part': video_part,
+                'time_range': f"{start_time} - {end_time}",
+                'engagement_level': moment['engagement_details'].get('engagement_level', 'N/A'),
+                'why_engaging': moment['why_engaging']
+            }
+            logger.info(f"✓ Saved: {output_filename}")
+            if subtitle_generated:
+                logger.info(f"✓ Subtitle: {subtitle_filename}")
+            else:
+                logger.info(f"⚠ No subtitle generated for this clip")
+            return clip_info
         
+        logger.error(f"✗ Failed: {output_filename}")
         return None
     
+    def _find_video_file(self, video_part: str, video_dir: Path, names: Tuple[str, ...]) -> Optional[str]:
+        """Find video file for a given part among the listed names of video_dir"""
+        return _find_part_file(video_dir, names, video_part, ".mp4")
+    
+    def _find_subtitle_file(self, video_part: str, subtitle_dir: Path, names: Tuple[str, ...]) -> Optional[str]:
+        """Find subtitle file for a given part among the listed names of subtitle_dir"""
+        return _find_part_file(subtitle_dir, names, video_part, ".srt")
+    
     def _parse_srt_file(self, srt_path: str) -> List[Dict]:
         """Parse SRT file and extract subtitle segments"""
         segments = []
@@ -232,11 +279,11 @@ class ClipGenerator:
     
     def _extract_subtitle_for_clip(self, video_part: str, start_time: str, 
                                     end_time: str, output_path: str, 
-                                    subtitle_dir: Path) -> bool:
+                                    subtitle_dir: Path, subtitle_names: Tuple[str, ...]) -> bool:
         """Extract subtitle segments for a clip's time range and save to file"""
         try:
             # Find subtitle file
-            subtitle_file = self._find_subtitle_file(video_part, subtitle_dir)
+            subtitle_file = self._find_subtitle_file(video_part, subtitle_dir, subtitle_names)
             if not subtitle_file:
                 logger.info(f"⚠ No subtitle file found for {video_part}")
                 return False
@@ -289,15 +336,8 @@ class ClipGenerator:
             return False
     
     def _sanitize_filename(self, title: str) -> str:
-        """Clean title for use as filename"""
-        # Remove emojis and special characters
-        title = re.sub(r'[^\w\s-]', '', title)
-        # Replace spaces with underscores
-        title = re.sub(r'[\s\-]+', '_', title)
-        # Remove multiple underscores
-        title = re.sub(r'_+', '_', title)
-        # Trim underscores
-        return title.strip('_')
+        """Clean title for filename (shared with the orchestrator so clip names always match)"""
+        return FileNameSanitizer.safe_name(title)
     
     def _time_to_seconds(self, time_str: str) -> int:
         """Convert MM:SS or HH:MM:SS to seconds"""
@@ -309,25 +349,34 @@ class ClipGenerator:
         return 0
     
     def _create_clip(self, input_video: str, start_time: str, 
-                    end_time: str, output_path: str, title: str) -> bool:
-        """Create a video clip using ffmpeg"""
+                    end_time: str, output_path: str, title: str,
+                    frame_path: Optional[str] = None) -> bool:
+        """
+        Create a video clip using ffmpeg
+        
+        When frame_path is given, the clip's first frame is written there as a
+        second output of the same ffmpeg run, so covers need no extra decode.
+        """
         try:
             start_seconds = self._time_to_seconds(start_time)
             end_seconds = self._time_to_seconds(end_time)
             duration = end_seconds - start_seconds
             
-            # Use ffmpeg to extract clip
+            # Use ffmpeg to extract clip; with stream copy, input seeking lands on the
+            # keyframe at or before start_time and no frame is decoded or encoded
+            codec_args = ['-c', 'copy'] if self.stream_copy else ['-c:v', 'libx264', '-c:a', 'aac']
             cmd = [
                 'ffmpeg',
                 '-ss', start_time,
                 '-i', input_video,
                 '-t', str(duration),
-                '-c:v', 'libx264',
-                '-c:a', 'aac',
+                *codec_args,
                 '-avoid_negative_ts', 'make_zero',
                 '-y',
                 output_path
             ]
+            if frame_path:
+                cmd += ['-frames:v', '1', '-an', frame_path]
             
             result = subprocess.run(
                 cmd,
@@ -345,41 +394,43 @@ class ClipGenerator:
             logger.error(f"Error creating clip: {e}")
             return False
     
-    def _create_summary(self, clips_info: List[Dict], data: Dict):
+    def _create_summary(self, clips_info: List[Dict], data: Dict, output_dir: Path):
         """Create markdown summary of generated clips"""
-        summary_path = self.output_dir / "engaging_moments_summary.md"
+        summary_path = output_dir / "engaging_moments_summary.md"
         
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            f.write("# 🔥 Top Engaging Moments - Video Clips\n\n")
-            f.write(f"**Total Clips**: {len(clips_info)}\n\n")
-            
-            if 'analysis_summary' in data:
-                f.write("## 📊 Analysis Summary\n")
-                f.write(f"**Highest Engagement Themes**: {', '.join(data['analysis_summary']['highest_engagement_themes'])}\n")
-                f.write(f"**Total Engaging Content Time**: {data['analysis_summary']['total_engaging_content_time']}\n")
-                f.write(f"**Recommendation**: {data['analysis_summary']['recommendation']}\n\n")
-            
-            f.write("## 🎬 Generated Clips\n\n")
-            f.write("| Rank | Title | Video File | Subtitle File | Duration | Engagement |\n")
-            f.write("|------|-------|------------|----------------|----------|------------|\n")
-            
-            for clip in clips_info:
-                subtitle_file = clip.get('subtitle_filename', 'N/A')
-                if subtitle_file:
-                    subtitle_file = f"`{subtitle_file}`"
-                else:
-                    subtitle_file = "N/A"
-                f.write(f"| {clip['rank']} | {clip['title']} | `{clip['filename']}` | "
-                       f"{subtitle_file} | {clip['duration']} | {clip['engagement_level']} |\n")
-            
-            f.write("\n## 📝 Detailed Descriptions\n\n")
-            for clip in clips_info:
-                f.write(f"### Rank {clip['rank']}: {clip['title']}\n")
-                f.write(f"**Time Range**: {clip['time_range']}\n")
-                f.write(f"**Duration**: {clip['duration']}\n")
-                f.write(f"**Video File**: `{clip['filename']}`\n")
-                if clip.get('subtitle_filename'):
-                    f.write(f"**Subtitle File**: `{clip['subtitle_filename']}`\n")
-                f.write(f"**Why Engaging**: {clip['why_engaging']}\n\n")
+        parts = []
+        parts.append("# 🔥 Top Engaging Moments - Video Clips\n\n")
+        parts.append(f"**Total Clips**: {len(clips_info)}\n\n")
+        
+        if 'analysis_summary' in data:
+            parts.append("## 📊 Analysis Summary\n")
+            parts.append(f"**Highest Engagement Themes**: {', '.join(data['analysis_summary']['highest_engagement_themes'])}\n")
+            parts.append(f"**Total Engaging Content Time**: {data['analysis_summary']['total_engaging_content_time']}\n")
+            parts.append(f"**Recommendation**: {data['analysis_summary']['recommendation']}\n\n")
+        
+        parts.append("## 🎬 Generated Clips\n\n")
+        parts.append("| Rank | Title | Video File | Subtitle File | Duration | Engagement |\n")
+        parts.append("|------|-------|------------|----------------|----------|------------|\n")
+        
+        for clip in clips_info:
+            subtitle_file = clip.get('subtitle_filename', 'N/A')
+            if subtitle_file:
+                subtitle_file = f"`{subtitle_file}`"
+            else:
+                subtitle_file = "N/A"
+            parts.append(f"| {clip['rank']} | {clip['title']} | `{clip['filename']}` | "
+                     f"{subtitle_file} | {clip['duration']} | {clip['engagement_level']} |\n")
+        
+        parts.append("\n## 📝 Detailed Descriptions\n\n")
+        for clip in clips_info:
+            parts.append(f"### Rank {clip['rank']}: {clip['title']}\n")
+            parts.append(f"**Time Range**: {clip['time_range']}\n")
+            parts.append(f"**Duration**: {clip['duration']}\n")
+            parts.append(f"**Video File**: `{clip['filename']}`\n")
+            if clip.get('subtitle_filename'):
+                parts.append(f"**Subtitle File**: `{clip['subtitle_filename']}`\n")
+            parts.append(f"**Why Engaging**: {clip['why_engaging']}\n\n")
+        
+        summary_path.write_text(''.join(parts), encoding='utf-8')
         
         logger.info(f"📄 Summary created: {summary_path}")
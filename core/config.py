@@ -2,7 +2,7 @@
 Configuration file for LLM clients and other components
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 
 
 # LLM Client configurations
@@ -47,14 +47,107 @@ MAX_DURATION_MINUTES: float = 20.0
 # Options: tiny, base, small, medium, large, turbo
 WHISPER_MODEL: str = "base"
 
+# Whisper backend for transcript generation
+# Options: openai (whisper CLI), faster-whisper (CTranslate2, quantized; needs `pip install faster-whisper`)
+WHISPER_BACKEND: str = "openai"
+
+# Device and weight precision for the faster-whisper backend
+# Device options: auto, cpu, cuda; compute type options: auto, int8, int8_float16, float16, float32
+WHISPER_DEVICE: str = "auto"
+WHISPER_COMPUTE_TYPE: str = "auto"
+
+# Compute type used per device when WHISPER_COMPUTE_TYPE is "auto": int8 weights keep
+# accuracy close to fp16 while halving memory traffic; GPUs run the activations in fp16
+WHISPER_AUTO_COMPUTE_TYPES: Dict[str, str] = {
+    "cuda": "int8_float16",
+    "cpu": "int8",
+}
+
+# Half-precision compute types CTranslate2 cannot run on CPU, mapped to the closest CPU type
+WHISPER_CPU_COMPUTE_FALLBACKS: Dict[str, str] = {
+    "float16": "float32",
+    "bfloat16": "float32",
+    "int8_float16": "int8",
+    "int8_bfloat16": "int8",
+}
+
+# CLI --precision presets mapped to faster-whisper (CTranslate2) compute types
+WHISPER_PRECISION_COMPUTE_TYPES: Dict[str, str] = {
+    "fp32": "float32",
+    "fp16": "float16",
+    "bf16": "bfloat16",
+    "int8": "int8",
+}
+
+# Skip silent stretches with faster-whisper's built-in Silero VAD before decoding
+WHISPER_VAD: bool = False
+
+# Batch size for faster-whisper's batched pipeline, which decodes several 30s windows of a
+# part in one forward pass (0 disables batching; 8-16 suits most GPUs)
+WHISPER_BATCH_SIZE: int = 0
+
+# Number of video parts transcribed at the same time
+# With the openai backend every worker is a separate whisper process holding its own model copy,
+# so raise this only if there is memory (RAM/VRAM) for several models
+WHISPER_WORKERS: int = 1
+
 # Title style for artistic text overlay
 # Options: gradient_3d, neon_glow, metallic_gold, rainbow_3d, crystal_ice,
 #          fire_flame, metallic_silver, glowing_plasma, stone_carved, glass_transparent
 DEFAULT_TITLE_STYLE: str = "fire_flame"
 
+# Font size presets (px) for artistic titles
+TITLE_FONT_SIZES: Dict[str, int] = {
+    "small": 30,
+    "medium": 40,
+    "large": 50,
+    "xlarge": 60,
+}
+
+# Named RGB colors for cover text fill and outline
+COVER_COLORS: Dict[str, Tuple[int, int, int]] = {
+    "yellow": (255, 220, 0),
+    "red": (255, 50, 50),
+    "white": (255, 255, 255),
+    "cyan": (0, 255, 255),
+    "green": (50, 255, 50),
+    "orange": (255, 165, 0),
+    "pink": (255, 105, 180),
+    "purple": (147, 112, 219),
+    "gold": (255, 215, 0),
+    "silver": (192, 192, 192),
+    "black": (0, 0, 0),
+}
+
 # Maximum number of highlight clips to generate
 MAX_CLIPS: int = 5
 
+# Maximum number of video parts analyzed by the LLM at the same time
+LLM_MAX_CONCURRENCY: int = 3
+
+# Keep-alive connections each LLM client keeps open to its API host; keep it at or
+# above --llm-concurrency so concurrent part analyses never open throwaway connections
+LLM_HTTP_POOL_SIZE: int = 16
+
+# Number of ffmpeg clip extractions to run in parallel
+CLIP_WORKERS: int = 4
+
+# Cut clips by copying the source streams instead of re-encoding them; far faster, but
+# each clip starts at the keyframe at or before the requested time (usually < 2s earlier)
+CLIP_STREAM_COPY: bool = False
+
+# Number of cover images rendered in parallel
+COVER_WORKERS: int = 4
+
+# JPEG quality for cover images (1-95); lower values encode faster and give smaller files
+COVER_JPEG_QUALITY: int = 95
+
+# Number of clips titled in parallel (each one runs its own ffmpeg encoder)
+TITLE_WORKERS: int = 2
+
+# Reuse transcript and analysis results from previous runs when their inputs are unchanged
+STAGE_CACHE_ENABLED: bool = True
+
 # Skip download by default (use existing files if available)
 SKIP_DOWNLOAD: bool = False
 
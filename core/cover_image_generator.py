@@ -2,59 +2,74 @@
 """
 Cover Image Generator - Create video cover images with styled text overlays
 """
+import io
 import logging
+import subprocess
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple, Dict
+from typing import Optional, Tuple, Dict, List
 import os
 
-from moviepy import VideoFileClip
 from PIL import Image, ImageDraw, ImageFont
 import numpy as np
 
+from core.config import COVER_COLORS, COVER_JPEG_QUALITY  # COVER_COLORS re-exported for existing imports
+
 logger = logging.getLogger(__name__)
 
 
-COVER_COLORS: Dict[str, Tuple[int, int, int]] = {
-    "yellow": (255, 220, 0),
-    "red": (255, 50, 50),
-    "white": (255, 255, 255),
-    "cyan": (0, 255, 255),
-    "green": (50, 255, 50),
-    "orange": (255, 165, 0),
-    "pink": (255, 105, 180),
-    "purple": (147, 112, 219),
-    "gold": (255, 215, 0),
-    "silver": (192, 192, 192),
-    "black": (0, 0, 0),
-}
+# Cover fonts in order of preference (bold variants first)
+COVER_FONT_CANDIDATES = [
+    # Bold variants first
+    "/System/Library/Fonts/PingFang.ttc",  # Has bold weight
+    "/System/Library/Fonts/STHeiti Medium.ttc",
+    "/System/Library/Fonts/Hiragino Sans GB.ttc",
+    "C:/Windows/Fonts/msyhbd.ttc",  # Microsoft YaHei Bold
+    "C:/Windows/Fonts/simhei.ttf",  # SimHei (bold)
+    # Regular variants as fallback
+    "/System/Library/Fonts/STHeiti Light.ttc",
+    "C:/Windows/Fonts/msyh.ttc",
+    "C:/Windows/Fonts/simsun.ttc",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+]
+
+
+@lru_cache(maxsize=1)
+def _find_cover_font() -> Optional[str]:
+    """Find available Chinese font (scanned once per process)"""
+    for font_path in COVER_FONT_CANDIDATES:
+        if os.path.exists(font_path):
+            return font_path
+    return None
+
+
+@lru_cache(maxsize=64)
+def _load_font(font_path: Optional[str], font_size: int):
+    """
+    Load a font face once per size.
+    
+    Fitting a title tries up to ~30 sizes, for both the horizontal and the
+    vertical cover of every clip, and each truetype() call re-parses the font
+    file, so faces are shared across covers.
+    """
+    if font_path:
+        try:
+            return ImageFont.truetype(font_path, font_size)
+        except Exception:
+            pass
+    return ImageFont.load_default()
 
 
 class CoverImageGenerator:
     """Generate cover images with styled text overlays from video frames"""
     
-    def __init__(self):
-        self.font_path = self._find_chinese_font()
-    
-    def _find_chinese_font(self):
-        """Find available Chinese font (prefer bold variants)"""
-        fonts = [
-            # Bold variants first
-            "/System/Library/Fonts/PingFang.ttc",  # Has bold weight
-            "/System/Library/Fonts/STHeiti Medium.ttc",
-            "/System/Library/Fonts/Hiragino Sans GB.ttc",
-            "C:/Windows/Fonts/msyhbd.ttc",  # Microsoft YaHei Bold
-            "C:/Windows/Fonts/simhei.ttf",  # SimHei (bold)
-            # Regular variants as fallback
-            "/System/Library/Fonts/STHeiti Light.ttc",
-            "C:/Windows/Fonts/msyh.ttc",
-            "C:/Windows/Fonts/simsun.ttc",
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
-        ]
-        
-        for font_path in fonts:
-            if os.path.exists(font_path):
-                return font_path
-        return None
+    def __init__(self, jpeg_quality: int = COVER_JPEG_QUALITY):
+        """
+        Args:
+            jpeg_quality: JPEG quality used when saving covers (1-95)
+        """
+        self.font_path = _find_cover_font()
+        self.jpeg_quality = jpeg_quality
     
     def generate_cover(self,
                       video_path: str,
@@ -86,36 +101,140 @@ class CoverImageGenerator:
         try:
             logger.info(f"🖼️  Generating cover image from: {Path(video_path).name}")
             
-            # Extract frame from video
-            video = VideoFileClip(video_path)
-            
             # Use specified time or middle of video
-            extract_time = min(frame_time, video.duration / 2)
-            frame = video.get_frame(extract_time)
-            video.close()
+            extract_time = frame_time
+            if frame_time > 0:
+                duration = self._probe_duration(video_path)
+                if duration:
+                    extract_time = min(frame_time, duration / 2)
             
-            # Convert to PIL Image
-            img = Image.fromarray(frame)
+            # Extract frame from video
+            img = self._extract_frame(video_path, extract_time)
+            
+            self._render_covers(img, title_text, output_path, generate_vertical,
+                                text_location, fill_color, outline_color)
+            return True
             
-            # Generate horizontal cover (original aspect ratio) with 70% width
-            img_horizontal = img.copy()  # Create a copy for horizontal cover
-            img_with_text = self._add_text_overlay(img_horizontal, title_text, max_width_ratio=0.7, text_location=text_location, fill_color=fill_color, outline_color=outline_color)
-            img_with_text.save(output_path, quality=95)
-            logger.info(f"✓ Cover saved: {Path(output_path).name}")
+        except Exception as e:
+            logger.error(f"Error generating cover: {e}")
+            return False
+    
+    def generate_cover_from_image(self,
+                                  image_path: str,
+                                  title_text: str,
+                                  output_path: str,
+                                  generate_vertical: bool = True,
+                                  text_location: str = "center",
+                                  fill_color: Tuple[int, int, int] = (255, 220, 0),
+                                  outline_color: Tuple[int, int, int] = (0, 0, 0)) -> bool:
+        """
+        Generate cover image from an already extracted frame (no video decode)
+        
+        Args:
+            image_path: Path to the frame image
+            title_text: Title text (large, red with outline)
+            output_path: Path to save cover image
+            generate_vertical: Also generate vertical 3:4 cover (default: True)
+            text_location: Text position on cover (default: "center"). Options: "top", "upper_middle", "bottom", "center"
+            fill_color: RGB tuple for text fill color (default: yellow 255,220,0)
+            outline_color: RGB tuple for text outline color (default: black 0,0,0)
             
-            # Generate vertical 3:4 cover if requested (use original clean img) with 80% width
-            if generate_vertical:
-                vertical_output_path = output_path.replace('.jpg', '_vertical.jpg')
-                img_vertical = self._create_vertical_cover(img, title_text, text_location=text_location, fill_color=fill_color, outline_color=outline_color)
-                img_vertical.save(vertical_output_path, quality=95)
-                logger.info(f"✓ Vertical cover saved: {Path(vertical_output_path).name}")
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            logger.info(f"🖼️  Generating cover image from: {Path(image_path).name}")
+            with Image.open(image_path) as frame:
+                img = frame.convert('RGB')
             
+            self._render_covers(img, title_text, output_path, generate_vertical,
+                                text_location, fill_color, outline_color)
             return True
             
         except Exception as e:
             logger.error(f"Error generating cover: {e}")
             return False
     
+    def extract_first_frames(self, video_paths: List[str], frame_paths: List[str]) -> bool:
+        """
+        Save the first frame of several videos with a single ffmpeg run
+        
+        Every video is opened as its own input and mapped to one single-frame
+        output, so N covers cost one process start instead of N.
+        
+        Args:
+            video_paths: Videos to grab the first frame from
+            frame_paths: Image path written for each video (same order)
+            
+        Returns:
+            True if every frame was written, False otherwise
+        """
+        cmd = ['ffmpeg', '-v', 'error', '-y']
+        for video_path in video_paths:
+            cmd += ['-i', video_path]
+        for index, frame_path in enumerate(frame_paths):
+            cmd += ['-map', f'{index}:v:0', '-frames:v', '1', frame_path]
+        try:
+            subprocess.run(cmd, capture_output=True, check=True)
+            return True
+        except subprocess.CalledProcessError as e:
+            logger.warning(f"⚠️  Batch frame extraction failed, decoding clips one by one: {e.stderr.decode(errors='ignore')}")
+            return False
+    
+    def _render_covers(self, img: Image.Image, title_text: str, output_path: str,
+                       generate_vertical: bool, text_location: str,
+                       fill_color: Tuple[int, int, int], outline_color: Tuple[int, int, int]):
+        """Overlay the title on a frame and save the horizontal (and vertical) covers"""
+        # Generate horizontal cover (original aspect ratio) with 70% width
+        img_horizontal = img.copy()  # Create a copy for horizontal cover
+        img_with_text = self._add_text_overlay(img_horizontal, title_text, max_width_ratio=0.7, text_location=text_location, fill_color=fill_color, outline_color=outline_color)
+        img_with_text.save(output_path, quality=self.jpeg_quality)
+        logger.info(f"✓ Cover saved: {Path(output_path).name}")
+        
+        # Generate vertical 3:4 cover if requested (use original clean img) with 80% width
+        if generate_vertical:
+            vertical_output_path = output_path.replace('.jpg', '_vertical.jpg')
+            img_vertical = self._create_vertical_cover(img, title_text, text_location=text_location, fill_color=fill_color, outline_color=outline_color)
+            img_vertical.save(vertical_output_path, quality=self.jpeg_quality)
+            logger.info(f"✓ Vertical cover saved: {Path(vertical_output_path).name}")
+
+    def _probe_duration(self, video_path: str) -> Optional[float]:
+        """Read container duration with ffprobe (None if unavailable)"""
+        try:
+            result = subprocess.run(
+                ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
+                 '-of', 'default=noprint_wrappers=1:nokey=1', video_path],
+                capture_output=True,
+                text=True,
+                check=True
+            )
+            return float(result.stdout.strip())
+        except (subprocess.CalledProcessError, ValueError):
+            return None
+    
+    def _extract_frame(self, video_path: str, frame_time: float) -> Image.Image:
+        """
+        Grab a single frame with ffmpeg.
+        
+        -ss is placed before -i so ffmpeg seeks in the container instead of
+        decoding everything up to frame_time. The frame comes back as PPM on
+        stdout, which carries its own dimensions and needs no temp file.
+        """
+        cmd = [
+            'ffmpeg',
+            '-v', 'error',
+            '-ss', f"{frame_time:.3f}",
+            '-i', video_path,
+            '-frames:v', '1',
+            '-f', 'image2pipe',
+            '-vcodec', 'ppm',
+            '-'
+        ]
+        result = subprocess.run(cmd, capture_output=True, check=True)
+        if not result.stdout:
+            raise RuntimeError(f"No frame decoded at {frame_time:.3f}s: {result.stderr.decode(errors='ignore')}")
+        return Image.open(io.BytesIO(result.stdout)).convert('RGB')
+    
     def _create_vertical_cover(self, img: Image.Image, title_text: str, text_location: str = "center",
                                fill_color: Tuple[int, int, int] = (255, 220, 0),
                                outline_color: Tuple[int, int, int] = (0, 0, 0)) -> Image.Image:
@@ -207,13 +326,7 @@ class CoverImageGenerator:
         
         while font_size >= min_font_size:
             # Try current font size
-            try:
-                if self.font_path:
-                    test_font = ImageFont.truetype(self.font_path, font_size)
-                else:
-                    test_font = ImageFont.load_default()
-            except:
-                test_font = ImageFont.load_default()
+            test_font = _load_font(self.font_path, font_size)
             
             # Check how many lines this would create
             wrapped_lines = self._wrap_text(text, test_font, max_width, draw)
@@ -226,13 +339,7 @@ class CoverImageGenerator:
             font_size -= 2
         
         # If we couldn't fit in max_lines, return the smallest font we tried
-        try:
-            if self.font_path:
-                return ImageFont.truetype(self.font_path, min_font_size)
-            else:
-                return ImageFont.load_default()
-        except:
-            return ImageFont.load_default()
+        return _load_font(self.font_path, min_font_size)
     
     def _wrap_text(self, text: str, font: ImageFont.FreeTypeFont, max_width: int, draw: ImageDraw.Draw) -> list:
         """Wrap text to fit within max_width (handles Chinese text without spaces)"""
@@ -294,15 +401,13 @@ class CoverImageGenerator:
         text_width = bbox[2] - bbox[0]
         text_x = x - text_width // 2
         
-        # Draw outline
-        for dx in range(-outline_width, outline_width + 1):
-            for dy in range(-outline_width, outline_width + 1):
-                if dx*dx + dy*dy <= outline_width*outline_width:
-                    draw.text((text_x + dx, y + dy), text, font=font, fill=outline_color)
+        # Draw outline: PIL's native stroke dilates the glyphs by a disc of
+        # radius outline_width in one pass (same shape as stamping the text at
+        # every offset inside that disc)
+        draw.text((text_x, y), text, font=font, fill=outline_color,
+                  stroke_width=outline_width, stroke_fill=outline_color)
         
-        # Draw main text with multiple offsets for extra thickness (2px spread)
-        for offset_x in [0, 1, 2]:
-            for offset_y in [0, 1, 2]:
-                if offset_x == 2 and offset_y == 2:
-                    continue  # Skip the far diagonal to keep it at 8 draws
-                draw.text((text_x + offset_x, y + offset_y), text, font=font, fill=fill_color)
+        # Draw main text thickened by ~2px: a 1px stroke around the (1, 1)
+        # offset covers the 0-2px offset grid the fill used to be stamped on
+        draw.text((text_x + 1, y + 1), text, font=font, fill=fill_color,
+                  stroke_width=1, stroke_fill=fill_color)
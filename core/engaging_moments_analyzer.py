@@ -4,18 +4,152 @@ Engaging Moments Analyzer
 Identifies engaging moments from video transcripts using Qwen API
 """
 
+import asyncio
 import json
 import logging
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+from functools import lru_cache
 import re
 
 from core.llm.qwen_api_client import QwenAPIClient, QwenMessage
 from core.config import MAX_CLIPS
+from core.video_utils import load_json_file, write_json_file
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is the fallback
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+_SRT_TIMING_RE = re.compile(r'(\d{2}:\d{2}:\d{2},\d{3}) --> (\d{2}:\d{2}:\d{2},\d{3})')
+
+
+def _loads_json(text: str) -> Any:
+    """Parse JSON with orjson when installed (its errors subclass json.JSONDecodeError)"""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # The stdlib also accepts NaN/Infinity and integers wider than 64 bits;
+            # only text both reject is treated as malformed
+            pass
+    return json.loads(text)
+
+
+def _find_json_code_block(text: str) -> Optional[str]:
+    r"""
+    Return the {...} body of the first ```json fenced block, or None
+    
+    Same result as the non-greedy pattern ```json\s*(\{.*?\})\s*```: the body
+    ends at the first '}' followed only by whitespace and a fence, so a fence
+    inside a string value does not end the block early.
+    """
+    start = text.find('```json')
+    while start != -1:
+        body_start = start + len('```json')
+        while body_start < len(text) and text[body_start].isspace():
+            body_start += 1
+        if text.startswith('{', body_start):
+            fence = text.find('```', body_start + 1)
+            while fence != -1:
+                end = fence
+                while end > body_start + 1 and text[end - 1].isspace():
+                    end -= 1
+                if end > body_start + 1 and text[end - 1] == '}':
+                    return text[body_start:end]
+                fence = text.find('```', fence + 1)
+        start = text.find('```json', start + 1)
+    return None
+
+
+def _find_json_object(text: str) -> Optional[str]:
+    """Return the span from the first '{' to the last '}', or None"""
+    start = text.find('{')
+    end = text.rfind('}')
+    if start == -1 or end < start:
+        return None
+    return text[start:end + 1]
+
+
+def _is_srt_ms_tail(out: List[str], text: str, i: int) -> bool:
+    """True if text[i] is the comma of an HH:MM:SS,mmm timestamp already copied to out"""
+    millis = text[i + 1:i + 4]
+    if len(out) < 8 or len(millis) != 3 or not millis.isdigit():
+        return False
+    tail = out[-8:]
+    return (tail[2] == ':' and tail[5] == ':'
+            and all(tail[k].isdigit() for k in (0, 1, 3, 4, 6, 7)))
+
+
+def _last_non_space(out: List[str]) -> int:
+    """Index of the last non-whitespace character in out (-1 if none)"""
+    j = len(out) - 1
+    while j >= 0 and out[j].isspace():
+        j -= 1
+    return j
+
+
+def _clean_json_text_fast(text: str) -> str:
+    """
+    Single left-to-right pass over LLM JSON output.
+    
+    Outside string literals it drops trailing commas before } or ] and
+    inserts the comma missing between }{ or ][. Everywhere it trims the
+    ,mmm millisecond tail from HH:MM:SS,mmm timestamps. Escapes are tracked
+    so quotes and brackets inside strings are left alone.
+    """
+    out: List[str] = []
+    in_string = False
+    escape = False
+    i = 0
+    n = len(text)
+    
+    while i < n:
+        ch = text[i]
+        
+        if ch == ',' and _is_srt_ms_tail(out, text, i):
+            i += 4
+            continue
+        
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == '\\':
+                escape = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in '}]':
+            j = _last_non_space(out)
+            if j >= 0 and out[j] == ',':
+                del out[j]
+        elif ch in '{[':
+            j = _last_non_space(out)
+            if j >= 0 and out[j] == ('}' if ch == '{' else ']'):
+                del out[j + 1:]
+                out.append(',')
+        
+        out.append(ch)
+        i += 1
+    
+    return ''.join(out)
+
+
+@lru_cache(maxsize=32)
+def _read_text_file(path: str, mtime_ns: int) -> str:
+    """Read and strip a prompt file; mtime_ns is part of the key so edits are picked up"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read().strip()
+
+
+def _read_prompt_file(path: Path) -> str:
+    """Read a prompt/background markdown file, served from cache while unchanged"""
+    return _read_text_file(str(path), path.stat().st_mtime_ns)
+
 
 class EngagingMomentsAnalyzer:
     """Analyzes video transcripts to identify engaging moments using LLM APIs"""
@@ -60,8 +194,7 @@ class EngagingMomentsAnalyzer:
         try:
             background_path = self.prompts_dir / "background" / "background.md"
             if background_path.exists():
-                with open(background_path, 'r', encoding='utf-8') as f:
-                    self.background_content = f.read().strip()
+                self.background_content = _read_prompt_file(background_path)
                 logger.info("📚 Background information loaded")
             else:
                 logger.warning(f"Background file not found: {background_path}")
@@ -128,8 +261,7 @@ class EngagingMomentsAnalyzer:
             custom_prompt_path = Path(self.custom_prompt_file)
             if custom_prompt_path.exists():
                 logger.info(f"📝 Using custom prompt file: {custom_prompt_path}")
-                with open(custom_prompt_path, 'r', encoding='utf-8') as f:
-                    prompt_content = f.read().strip()
+                prompt_content = _read_prompt_file(custom_prompt_path)
             else:
                 logger.warning(f"Custom prompt file not found: {custom_prompt_path}")
                 logger.info(f"Falling back to default prompt: engaging_moments_part_requirement.md")
@@ -137,8 +269,7 @@ class EngagingMomentsAnalyzer:
                 base_prompt_path = self.prompts_dir / f"{prompt_name}.md"
                 if not base_prompt_path.exists():
                     raise FileNotFoundError(f"Base prompt file not found: {base_prompt_path}")
-                with open(base_prompt_path, 'r', encoding='utf-8') as f:
-                    prompt_content = f.read().strip()
+                prompt_content = _read_prompt_file(base_prompt_path)
         else:
             # Load base prompt template (without language suffix)
             base_prompt_path = self.prompts_dir / f"{prompt_name}.md"
@@ -146,15 +277,13 @@ class EngagingMomentsAnalyzer:
             if not base_prompt_path.exists():
                 raise FileNotFoundError(f"Base prompt file not found: {base_prompt_path}")
             
-            with open(base_prompt_path, 'r', encoding='utf-8') as f:
-                prompt_content = f.read().strip()
+            prompt_content = _read_prompt_file(base_prompt_path)
         
         # Load and append language-specific patch
         language_patch_path = self.prompts_dir / "language_patches" / f"{self.language}.md"
         
         if language_patch_path.exists():
-            with open(language_patch_path, 'r', encoding='utf-8') as f:
-                language_patch = f.read().strip()
+            language_patch = _read_prompt_file(language_patch_path)
             
             # Append language patch to the base prompt
             prompt_content += "\n\n" + language_patch
@@ -187,7 +316,7 @@ class EngagingMomentsAnalyzer:
                 lines = block.strip().split('\n')
                 if len(lines) >= 3:
                     # Parse timing line (format: 00:00:00,000 --> 00:00:02,000)
-                    timing_match = re.match(r'(\d{2}:\d{2}:\d{2},\d{3}) --> (\d{2}:\d{2}:\d{2},\d{3})', lines[1])
+                    timing_match = _SRT_TIMING_RE.match(lines[1])
                     if timing_match:
                         start_time = timing_match.group(1)
                         end_time = timing_match.group(2)
@@ -278,8 +407,7 @@ class EngagingMomentsAnalyzer:
         all_moments = []
         for file_path in highlights_files:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = load_json_file(file_path)
                 for moment in data.get('engaging_moments', []):
                     moment['source_part'] = data.get('video_part', 'unknown')
                     all_moments.append(moment)
@@ -328,12 +456,15 @@ class EngagingMomentsAnalyzer:
         self._export_debug_prompt(analysis_prompt, "part_analysis", part_name)
         
         try:
-            # Call LLM API
-            response = self.llm_client.simple_chat(analysis_prompt)
+            # Call LLM API off the event loop so several parts can be in flight
+            loop = asyncio.get_event_loop()
+            response = await loop.run_in_executor(None, self.llm_client.simple_chat, analysis_prompt)
             
-            # Try to parse JSON response with improved extraction
+            # Try to parse JSON response with improved extraction (may call the LLM again to repair it)
             try:
-                result = self._extract_and_parse_json(response, part_name, entries)
+                result = await loop.run_in_executor(
+                    None, self._extract_and_parse_json, response, part_name, entries
+                )
                 
             except json.JSONDecodeError as e:
                 logger.error(f"Failed to parse JSON response: {e}")
@@ -364,27 +495,36 @@ class EngagingMomentsAnalyzer:
         # First try standard JSON parsing
         try:
             # Try direct parsing first
-            result = json.loads(response.strip())
+            result = _loads_json(response.strip())
             logger.debug("Successfully parsed response as direct JSON")
             return self._validate_and_clean_result(result, part_name, entries)
         except json.JSONDecodeError:
             pass
         
         # Try extracting from code blocks
-        json_match = re.search(r'```json\s*(\{.*?\})\s*```', response, re.DOTALL)
-        if json_match:
+        code_block = _find_json_code_block(response)
+        if code_block:
             try:
-                result = json.loads(json_match.group(1))
+                result = _loads_json(code_block)
                 logger.debug("Successfully parsed JSON from code block")
                 return self._validate_and_clean_result(result, part_name, entries)
             except json.JSONDecodeError:
                 pass
         
+        # Try again after cleaning common formatting issues before paying for an AI fix
+        try:
+            result = _loads_json(self._clean_json_text(code_block or response))
+            if isinstance(result, dict):
+                logger.debug("Successfully parsed JSON after cleaning")
+                return self._validate_and_clean_result(result, part_name, entries)
+        except json.JSONDecodeError:
+            pass
+        
         # If standard parsing fails, use AI to fix the JSON
         logger.info("Standard JSON parsing failed, using AI to fix JSON...")
         try:
             fixed_json = self._ai_fix_json(response, part_name)
-            result = json.loads(fixed_json)
+            result = _loads_json(fixed_json)
             logger.debug("Successfully parsed AI-fixed JSON")
             return self._validate_and_clean_result(result, part_name, entries)
         except Exception as e:
@@ -445,14 +585,14 @@ Please fix the JSON and return ONLY the valid JSON, no explanations:
             fixed_response = self.llm_client.simple_chat(fix_prompt)
             
             # Extract JSON from the fixed response
-            json_match = re.search(r'```json\s*(\{.*?\})\s*```', fixed_response, re.DOTALL)
-            if json_match:
-                return json_match.group(1)
+            code_block = _find_json_code_block(fixed_response)
+            if code_block:
+                return code_block
             
             # Try to find JSON object in response
-            json_match = re.search(r'\{.*\}', fixed_response, re.DOTALL)
-            if json_match:
-                return json_match.group()
+            json_object = _find_json_object(fixed_response)
+            if json_object:
+                return json_object
             
             # If no JSON found, return the entire response
             return fixed_response.strip()
@@ -475,21 +615,14 @@ Please fix the JSON and return ONLY the valid JSON, no explanations:
         json_text = json_text.strip()
         
         # Remove markdown code block markers if present
-        json_text = re.sub(r'^```json\s*', '', json_text)
-        json_text = re.sub(r'\s*```$', '', json_text)
-        
-        # Fix common trailing comma issues
-        json_text = re.sub(r',(\s*[}\]])', r'\1', json_text)
-        
-        # Fix missing commas between objects/arrays (basic fix)
-        json_text = re.sub(r'}\s*{', '},{', json_text)
-        json_text = re.sub(r']\s*\[', '],[', json_text)
-        
-        # Convert SRT timestamp format to simple format if present
-        # Convert HH:MM:SS,mmm to HH:MM:SS
-        json_text = re.sub(r'(\d{2}:\d{2}:\d{2}),\d{3}', r'\1', json_text)
+        if json_text.startswith('```json'):
+            json_text = json_text[len('```json'):].lstrip()
+        if json_text.endswith('```'):
+            json_text = json_text[:-3].rstrip()
         
-        return json_text
+        # Trailing commas, missing commas between objects/arrays and
+        # HH:MM:SS,mmm -> HH:MM:SS in a single pass
+        return _clean_json_text_fast(json_text)
     
     def _validate_and_clean_result(self, result: Dict[str, Any], part_name: str, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Validate and clean up the analysis result"""
@@ -581,8 +714,7 @@ Please fix the JSON and return ONLY the valid JSON, no explanations:
         all_moments = []
         for file_path in highlights_files:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = load_json_file(file_path)
                 for moment in data.get('engaging_moments', []):
                     all_moments.append(moment)
             except Exception as e:
@@ -635,27 +767,36 @@ Please fix the JSON and return ONLY the valid JSON, no explanations:
         # First try standard JSON parsing
         try:
             # Try direct parsing first
-            result = json.loads(response.strip())
+            result = _loads_json(response.strip())
             logger.debug("Successfully parsed aggregation response as direct JSON")
             return self._validate_aggregation_result(result)
         except json.JSONDecodeError:
             pass
         
         # Try extracting from code blocks
-        json_match = re.search(r'```json\s*(\{.*?\})\s*```', response, re.DOTALL)
-        if json_match:
+        code_block = _find_json_code_block(response)
+        if code_block:
             try:
-                result = json.loads(json_match.group(1))
+                result = _loads_json(code_block)
                 logger.debug("Successfully parsed aggregation JSON from code block")
                 return self._validate_aggregation_result(result)
             except json.JSONDecodeError:
                 pass
         
+        # Try again after cleaning common formatting issues before paying for an AI fix
+        try:
+            result = _loads_json(self._clean_json_text(code_block or response))
+            if isinstance(result, dict):
+                logger.debug("Successfully parsed aggregation JSON after cleaning")
+                return self._validate_aggregation_result(result)
+        except json.JSONDecodeError:
+            pass
+        
         # If standard parsing fails, use AI to fix the JSON
         logger.info("Standard aggregation JSON parsing failed, using AI to fix JSON...")
         try:
             fixed_json = self._ai_fix_aggregation_json(response)
-            result = json.loads(fixed_json)
+            result = _loads_json(fixed_json)
             logger.debug("Successfully parsed AI-fixed aggregation JSON")
             return self._validate_aggregation_result(result)
         except Exception as e:
@@ -724,14 +865,14 @@ Please fix the JSON and return ONLY the valid JSON, no explanations:
             fixed_response = self.llm_client.simple_chat(fix_prompt)
             
             # Extract JSON from the fixed response
-            json_match = re.search(r'```json\s*(\{.*?\})\s*```', fixed_response, re.DOTALL)
-            if json_match:
-                return json_match.group(1)
+            code_block = _find_json_code_block(fixed_response)
+            if code_block:
+                return code_block
             
             # Try to find JSON object in response
-            json_match = re.search(r'\{.*\}', fixed_response, re.DOTALL)
-            if json_match:
-                return json_match.group()
+            json_object = _find_json_object(fixed_response)
+            if json_object:
+                return json_object
             
             # If no JSON found, return the entire response
             return fixed_response.strip()
@@ -906,8 +1047,9 @@ Moment {i}:
     async def save_highlights_to_file(self, highlights: Dict[str, Any], output_path: str):
         """Save highlights analysis to JSON file"""
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(highlights, f, ensure_ascii=False, indent=2)
+            # Write from a worker thread so concurrent part analyses keep running
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(None, write_json_file, highlights, output_path)
             logger.info(f"💾 Highlights saved to: {output_path}")
         except Exception as e:
             logger.error(f"Error saving highlights to {output_path}: {e}")
@@ -8,7 +8,7 @@ from typing import Dict, List, Optional, Any
 import os
 from dataclasses import dataclass
 
-from core.config import LLM_CONFIG, API_KEY_ENV_VARS
+from core.config import LLM_CONFIG, API_KEY_ENV_VARS, LLM_HTTP_POOL_SIZE
 
 
 @dataclass
@@ -34,16 +34,23 @@ class OpenRouterAPIClient:
         
         if not self.api_key:
             raise ValueError(f"API key is required. Set {API_KEY_ENV_VARS['openrouter']} environment variable or pass api_key parameter.")
+        
+        # One session per client keeps the TCP/TLS connection alive across requests
+        self.session = requests.Session()
+        # Parts are analyzed from several threads at once; size the pool so each
+        # of them gets a reusable connection instead of one that is discarded
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=LLM_HTTP_POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        })
     
     def _make_request(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Make HTTP request to OpenRouter API"""
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        
         try:
-            response = requests.post(self.base_url, headers=headers, json=payload)
+            response = self.session.post(self.base_url, json=payload)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Stage Cache - Content-addressed cache for expensive pipeline stages
+
+Each stage result is stored as JSON under <cache_dir>/<stage>/<key>.json, where
+the key is a hash of the stage inputs (file fingerprints plus the settings that
+influence the output). Re-running the pipeline on unchanged inputs can then skip
+transcription and LLM analysis entirely.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+try:
+    import xxhash
+except ImportError:  # optional speed-up; hashlib is the fallback
+    xxhash = None
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the shape of cached stage results changes
+CACHE_VERSION = 1
+
+# Bytes hashed from the head and tail of each file when fingerprinting
+FINGERPRINT_CHUNK_SIZE = 1024 * 1024
+
+
+@lru_cache(maxsize=256)
+def _fingerprint(path: str, size: int, mtime_ns: int) -> str:
+    """Hash the size, head and tail of a file (size/mtime are part of the cache key)"""
+    # Fingerprints only need to tell files apart, so use the much faster
+    # non-cryptographic xxh3 when installed
+    digest = xxhash.xxh3_128() if xxhash is not None else hashlib.sha256()
+    digest.update(str(size).encode())
+    with open(path, 'rb') as f:
+        digest.update(f.read(FINGERPRINT_CHUNK_SIZE))
+        if size > 2 * FINGERPRINT_CHUNK_SIZE:
+            f.seek(-FINGERPRINT_CHUNK_SIZE, os.SEEK_END)
+            digest.update(f.read(FINGERPRINT_CHUNK_SIZE))
+    return digest.hexdigest()
+
+
+def file_fingerprint(path: str) -> Optional[str]:
+    """
+    Fingerprint a file's content without reading all of it
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Hex digest, or None if the file does not exist
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return _fingerprint(str(path), stat.st_size, stat.st_mtime_ns)
+
+
+class StageCache:
+    """Stores and retrieves pipeline stage results keyed by their inputs"""
+
+    def __init__(self, cache_dir: str, enabled: bool = True):
+        """
+        Initialize stage cache
+
+        Args:
+            cache_dir: Directory holding one subdirectory per stage
+            enabled: When False, every lookup misses and nothing is written
+        """
+        self.cache_dir = Path(cache_dir)
+        self.enabled = enabled
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Build a cache key from JSON-serializable stage inputs"""
+        payload = json.dumps([CACHE_VERSION, *parts], sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, stage: str, key: str) -> Path:
+        return self.cache_dir / stage / f"{key}.json"
+
+    def get(self, stage: str, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached stage result
+
+        Args:
+            stage: Stage name (e.g. "transcript", "analysis")
+            key: Key returned by make_key
+
+        Returns:
+            Cached result dictionary, or None on a miss
+        """
+        if not self.enabled:
+            return None
+        entry_path = self._entry_path(stage, key)
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                value = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"⚠️  Ignoring unreadable cache entry {entry_path}: {e}")
+            return None
+        logger.info(f"♻️  Cache hit: {stage}")
+        return value
+
+    def put(self, stage: str, key: str, value: Dict[str, Any]) -> None:
+        """
+        Store a stage result
+
+        Args:
+            stage: Stage name (e.g. "transcript", "analysis")
+            key: Key returned by make_key
+            value: JSON-serializable result dictionary
+        """
+        if not self.enabled:
+            return
+        entry_path = self._entry_path(stage, key)
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file first so a crash never leaves a truncated entry
+            tmp_path = entry_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(value, f, ensure_ascii=False, default=str)
+            os.replace(tmp_path, entry_path)
+        except OSError as e:
+            logger.warning(f"⚠️  Failed to write cache entry {entry_path}: {e}")
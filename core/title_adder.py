@@ -2,62 +2,63 @@
 """
 Title Adder - Add artistic titles to video clips
 """
-import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Any
-import re
+from functools import lru_cache
 
-from moviepy import VideoFileClip, ImageClip, CompositeVideoClip, ColorClip
+from moviepy import VideoFileClip, VideoClip
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 import numpy as np
 import os
 
+from core.video_utils import load_json_file, FileNameSanitizer
+from core.config import TITLE_FONT_SIZES, TITLE_WORKERS  # TITLE_FONT_SIZES re-exported for existing imports
+
 logger = logging.getLogger(__name__)
 
 
-TITLE_FONT_SIZES: Dict[str, int] = {
-    "small": 30,
-    "medium": 40,
-    "large": 50,
-    "xlarge": 60,
-}
+CHINESE_FONT_CANDIDATES = [
+    "/System/Library/Fonts/STHeiti Light.ttc",
+    "/System/Library/Fonts/PingFang.ttc",
+    "/System/Library/Fonts/Hiragino Sans GB.ttc",
+    "C:/Windows/Fonts/simsun.ttc",
+    "C:/Windows/Fonts/msyh.ttc",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+]
+
+
+@lru_cache(maxsize=1)
+def _find_chinese_font() -> Optional[str]:
+    """Find available Chinese font (scanned once per process)"""
+    for font_path in CHINESE_FONT_CANDIDATES:
+        if os.path.exists(font_path):
+            return font_path
+    return None
+
+
+@lru_cache(maxsize=16)
+def _load_font(font_path: Optional[str], font_size: int):
+    """Load a font face, shared by every renderer in the process"""
+    if font_path:
+        try:
+            return ImageFont.truetype(font_path, font_size)
+        except Exception:
+            pass
+    return ImageFont.load_default()
 
 
 class ArtisticTextRenderer:
     """Artistic text renderer for Chinese and other languages"""
     
     def __init__(self):
-        self.font_path = self._find_chinese_font()
-        self.font_cache = {}
-    
-    def _find_chinese_font(self):
-        """Find available Chinese font"""
-        fonts = [
-            "/System/Library/Fonts/STHeiti Light.ttc",
-            "/System/Library/Fonts/PingFang.ttc",
-            "/System/Library/Fonts/Hiragino Sans GB.ttc",
-            "C:/Windows/Fonts/simsun.ttc",
-            "C:/Windows/Fonts/msyh.ttc",
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
-        ]
-        
-        for font_path in fonts:
-            if os.path.exists(font_path):
-                return font_path
-        return None
+        self.font_path = _find_chinese_font()
     
     def _get_font(self, font_size):
         """Get cached font"""
-        if font_size not in self.font_cache:
-            if self.font_path:
-                try:
-                    self.font_cache[font_size] = ImageFont.truetype(self.font_path, font_size)
-                except:
-                    self.font_cache[font_size] = ImageFont.load_default()
-            else:
-                self.font_cache[font_size] = ImageFont.load_default()
-        return self.font_cache[font_size]
+        return _load_font(self.font_path, font_size)
     
     def create_artistic_text(self, text, font_size=35, style='gradient_3d'):
         """Create artistic text image"""
@@ -179,8 +180,6 @@ class ArtisticTextRenderer:
     
     def _create_rainbow_3d(self, text, font, img_width, img_height, x_pos, y_pos):
         """Rainbow 3D effect"""
-        import colorsys
-        
         shadow_img = Image.new('RGBA', (img_width, img_height), (0, 0, 0, 0))
         shadow_draw = ImageDraw.Draw(shadow_img)
         
@@ -189,15 +188,24 @@ class ArtisticTextRenderer:
             shadow_draw.text((x_pos + depth, y_pos + depth), text,
                            font=font, fill=(0, 0, 0, shadow_alpha))
         
-        rainbow_array = np.zeros((img_height, img_width, 4), dtype=np.uint8)
-        
-        for x in range(img_width):
-            hue = (x / img_width) * 0.8
-            rgb = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-            rainbow_array[:, x, 0] = int(rgb[0] * 255)
-            rainbow_array[:, x, 1] = int(rgb[1] * 255)
-            rainbow_array[:, x, 2] = int(rgb[2] * 255)
-            rainbow_array[:, x, 3] = 255
+        # Hue sweep across columns; HSV -> RGB with s = v = 1 (same as colorsys)
+        hue = np.arange(img_width) / img_width * 0.8
+        sector = (hue * 6.0).astype(np.int64) % 6
+        frac = hue * 6.0 - np.floor(hue * 6.0)
+        ones = np.ones_like(frac)
+        zeros = np.zeros_like(frac)
+        rising, falling = frac, 1.0 - frac
+        
+        sectors = [sector == i for i in range(6)]
+        red = np.select(sectors, [ones, falling, zeros, zeros, rising, ones])
+        green = np.select(sectors, [rising, ones, ones, falling, zeros, zeros])
+        blue = np.select(sectors, [zeros, zeros, rising, ones, ones, falling])
+        
+        rainbow_array = np.empty((img_height, img_width, 4), dtype=np.uint8)
+        rainbow_array[:, :, 0] = (red * 255).astype(np.uint8)
+        rainbow_array[:, :, 1] = (green * 255).astype(np.uint8)
+        rainbow_array[:, :, 2] = (blue * 255).astype(np.uint8)
+        rainbow_array[:, :, 3] = 255
         
         rainbow_img = Image.fromarray(rainbow_array, 'RGBA')
         
@@ -431,14 +439,16 @@ class ArtisticTextRenderer:
 class TitleAdder:
     """Add artistic titles to video clips"""
     
-    def __init__(self, output_dir: str = "engaging_clips_with_titles"):
+    def __init__(self, output_dir: str = "engaging_clips_with_titles", max_workers: int = TITLE_WORKERS):
         """
         Initialize title adder
         
         Args:
             output_dir: Directory to save videos with titles
+            max_workers: Number of clips titled concurrently
         """
         self.output_dir = Path(output_dir)
+        self.max_workers = max(1, max_workers)
         self.output_dir.mkdir(exist_ok=True)
         self.renderer = ArtisticTextRenderer()
         logger.info(f"📁 Title output directory: {self.output_dir}")
@@ -448,7 +458,8 @@ class TitleAdder:
                            analysis_file: str,
                            title_style: str = 'crystal_ice',
                            font_size: int = 35,
-                           progress_callback: Optional[callable] = None) -> Dict[str, Any]:
+                           progress_callback: Optional[callable] = None,
+                           output_dir: Optional[str] = None) -> Dict[str, Any]:
         """
         Add titles to generated clips
         
@@ -458,87 +469,76 @@ class TitleAdder:
             title_style: Style for artistic text rendering
             font_size: Font size for title text (default: 35)
             progress_callback: Optional callback function(status: str, progress: float) to report progress
+            output_dir: Directory for this run's titled clips (defaults to the adder's output_dir)
             
         Returns:
             Dictionary with processing results
         """
+        # The Streamlit callback raises to cancel; that must abort the whole stage
+        # rather than be logged as one failed clip or a failed title step
+        callback_errors: List[Exception] = []
+        
+        def report(status: str, progress: float):
+            try:
+                progress_callback(status, progress)
+            except Exception as e:
+                callback_errors.append(e)
+                raise
+        
         try:
             clips_dir = Path(clips_dir)
+            output_dir = Path(output_dir) if output_dir else self.output_dir
             
             if not clips_dir.exists():
                 raise FileNotFoundError(f"Clips directory not found: {clips_dir}")
             
             # Load analysis data
-            with open(analysis_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json_file(analysis_file)
             
             logger.info("🎨 Adding artistic titles to clips")
             logger.info(f"🎨 Style: {title_style}")
-            logger.info(f"📁 Output: {self.output_dir}")
+            logger.info(f"📁 Output: {output_dir}")
             
-            successful_count = 0
-            processed_clips = []
-            total_moments = len(data['top_engaging_moments'])
+            moments = data['top_engaging_moments']
+            total_moments = len(moments)
+            completed = 0
+            progress_lock = threading.Lock()
             
-            # Process each engaging moment
-            for i, moment in enumerate(data['top_engaging_moments']):
-                rank = moment['rank']
-                title = moment['title']
-                
-                # Report progress
-                if progress_callback:
-                    progress = (i / total_moments) * 100
-                    progress_callback(f"Adding titles - clip {i+1}/{total_moments}: {title[:30]}...", progress)
-                
-                # Find input clip
-                safe_title = self._sanitize_filename(title)
-                input_filename = f"rank_{rank:02d}_{safe_title}.mp4"
-                input_path = clips_dir / input_filename
-                
-                if not input_path.exists():
-                    logger.warning(f"✗ Clip not found: {input_filename}")
-                    continue
-                
-                # Create output filename
-                output_filename = f"artistic_{title_style}_rank_{rank:02d}_{safe_title}.mp4"
-                output_path = self.output_dir / output_filename
-                
-                logger.info(f"[{rank}] Processing: {title}")
-                
-                # Add title overlay
-                success = self._add_artistic_title(
-                    str(input_path),
-                    title,
-                    str(output_path),
-                    title_style,
-                    font_size
-                )
-                
-                if success:
-                    successful_count += 1
-                    processed_clips.append({
-                        'rank': rank,
-                        'title': title,
-                        'filename': output_filename
-                    })
-                    logger.info(f"✓ Saved: {output_filename}")
-                else:
-                    logger.error(f"✗ Failed: {output_filename}")
+            if progress_callback:
+                report(f"Adding titles - 0/{total_moments} clips", 0)
+            
+            def process(moment: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+                nonlocal completed
+                if callback_errors:  # cancelled: skip clips still queued
+                    return None
+                clip = self._process_moment(moment, clips_dir, output_dir, title_style, font_size)
+                with progress_lock:
+                    completed += 1
+                    if progress_callback:
+                        progress = (completed / total_moments) * 100
+                        report(f"Adding titles - clip {completed}/{total_moments}: {moment['title'][:30]}...", progress)
+                return clip
+            
+            # Each title render is frame compositing in numpy plus an ffmpeg encode
+            # subprocess, so a few clips can be rendered side by side; map() keeps rank order
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, max(1, total_moments))) as executor:
+                processed_clips = [clip for clip in executor.map(process, moments) if clip]
+            successful_count = len(processed_clips)
             
             # Report completion
             if progress_callback:
-                progress_callback(f"Finished adding titles to {successful_count}/{total_moments} clips", 100)
+                report(f"Finished adding titles to {successful_count}/{total_moments} clips", 100)
             
             # Create README
             if processed_clips:
-                self._create_readme(processed_clips, data, title_style)
+                self._create_readme(processed_clips, data, title_style, output_dir)
             
             result = {
                 'success': successful_count > 0,
                 'total_clips': len(data['top_engaging_moments']),
                 'successful_clips': successful_count,
                 'processed_clips': processed_clips,
-                'output_dir': str(self.output_dir),
+                'output_dir': str(output_dir),
                 'title_style': title_style
             }
             
@@ -546,6 +546,8 @@ class TitleAdder:
             return result
             
         except Exception as e:
+            if callback_errors:
+                raise callback_errors[0]
             logger.error(f"Error adding titles: {e}")
             return {
                 'success': False,
@@ -555,12 +557,50 @@ class TitleAdder:
                 'processed_clips': []
             }
     
+    def _process_moment(self, moment: Dict[str, Any], clips_dir: Path, output_dir: Path,
+                        title_style: str, font_size: int) -> Optional[Dict[str, Any]]:
+        """Render the title onto one moment's clip; returns clip info or None"""
+        rank = moment['rank']
+        title = moment['title']
+        
+        # Find input clip
+        safe_title = self._sanitize_filename(title)
+        input_filename = f"rank_{rank:02d}_{safe_title}.mp4"
+        input_path = clips_dir / input_filename
+        
+        if not input_path.exists():
+            logger.warning(f"✗ Clip not found: {input_filename}")
+            return None
+        
+        # Create output filename
+        output_filename = f"artistic_{title_style}_rank_{rank:02d}_{safe_title}.mp4"
+        output_path = output_dir / output_filename
+        
+        logger.info(f"[{rank}] Processing: {title}")
+        
+        # Add title overlay
+        success = self._add_artistic_title(
+            str(input_path),
+            title,
+            str(output_path),
+            title_style,
+            font_size
+        )
+        
+        if success:
+            logger.info(f"✓ Saved: {output_filename}")
+            return {
+                'rank': rank,
+                'title': title,
+                'filename': output_filename
+            }
+        
+        logger.error(f"✗ Failed: {output_filename}")
+        return None
+    
     def _sanitize_filename(self, title: str) -> str:
-        """Clean title for filename"""
-        title = re.sub(r'[^\w\s-]', '', title)
-        title = re.sub(r'[\s\-]+', '_', title)
-        title = re.sub(r'_+', '_', title)
-        return title.strip('_')
+        """Clean title for filename (shared with the orchestrator so clip names always match)"""
+        return FileNameSanitizer.safe_name(title)
     
     def _add_artistic_title(self, input_video: str, title: str,
                            output_video: str, title_style: str, font_size: int = 40) -> bool:
@@ -575,16 +615,6 @@ class TitleAdder:
             bottom_bar_height = 60
             new_height = original_height + top_bar_height + bottom_bar_height
             
-            # Create black background
-            black_bg = ColorClip(
-                size=(original_width, new_height),
-                color=(0, 0, 0),
-                duration=video.duration
-            )
-            
-            # Position video
-            video_positioned = video.with_position(('center', top_bar_height))
-            
             # Create artistic text
             artistic_img = self.renderer.create_artistic_text(
                 title,
@@ -592,14 +622,23 @@ class TitleAdder:
                 style=title_style
             )
             
-            # Position title
+            # Black bars and title are static, so blend them once and only
+            # paste each video frame into the prepared canvas
             title_y_position = (top_bar_height - artistic_img.shape[0]) // 2
-            artistic_clip = ImageClip(artistic_img, duration=video.duration).with_position(
-                ('center', title_y_position)
+            canvas, title_box, title_rgb, title_inv_alpha = self._build_title_overlay(
+                artistic_img, original_width, new_height, title_y_position
             )
+            top, bottom, left, right = title_box
             
-            # Composite
-            final_video = CompositeVideoClip([black_bg, video_positioned, artistic_clip])
+            def make_frame(t):
+                frame = canvas.copy()
+                frame[top_bar_height:top_bar_height + original_height] = video.get_frame(t)
+                if bottom > top and right > left:
+                    region = frame[top:bottom, left:right]
+                    region[:] = (region * title_inv_alpha + title_rgb) // 255
+                return frame
+            
+            final_video = VideoClip(make_frame, duration=video.duration).with_audio(video.audio)
             
             # Write output
             final_video.write_videofile(
@@ -615,8 +654,6 @@ class TitleAdder:
             # Cleanup
             video.close()
             final_video.close()
-            artistic_clip.close()
-            black_bg.close()
             
             return True
             
@@ -624,23 +661,61 @@ class TitleAdder:
             logger.error(f"Error adding title: {e}")
             return False
     
-    def _create_readme(self, processed_clips: List[Dict], data: Dict, title_style: str):
+    def _build_title_overlay(self, artistic_img: np.ndarray, width: int, height: int,
+                             title_y: int):
+        """Precompute the static part of a titled frame.
+
+        Returns the black RGB canvas, the (top, bottom, left, right) box the
+        visible title pixels cover after clipping to the canvas, and the
+        premultiplied title colour plus inverse alpha for that box (uint16,
+        scaled by 255).
+        """
+        canvas = np.zeros((height, width, 3), dtype=np.uint8)
+        
+        text_height, text_width = artistic_img.shape[:2]
+        title_x = (width - text_width) // 2
+        top, left = max(title_y, 0), max(title_x, 0)
+        bottom = min(title_y + text_height, height)
+        right = min(title_x + text_width, width)
+        
+        text = artistic_img[top - title_y:bottom - title_y, left - title_x:right - title_x]
+        
+        # Shrink the box to pixels the title actually covers; the renderer
+        # pads every image with a transparent margin
+        visible = text[:, :, 3] > 0
+        rows = np.flatnonzero(visible.any(axis=1))
+        cols = np.flatnonzero(visible.any(axis=0))
+        if rows.size == 0:
+            empty = np.zeros((0, 0, 3), dtype=np.uint16)
+            return canvas, (0, 0, 0, 0), empty, empty
+        text = text[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1]
+        top, bottom = top + rows[0], top + rows[-1] + 1
+        left, right = left + cols[0], left + cols[-1] + 1
+        
+        alpha = text[:, :, 3:4].astype(np.uint16)
+        title_rgb = text[:, :, :3].astype(np.uint16) * alpha + 127
+        
+        return canvas, (top, bottom, left, right), title_rgb, 255 - alpha
+    
+    def _create_readme(self, processed_clips: List[Dict], data: Dict, title_style: str, output_dir: Path):
         """Create README for titled clips"""
-        readme_path = self.output_dir / "README.md"
+        readme_path = output_dir / "README.md"
         
-        with open(readme_path, 'w', encoding='utf-8') as f:
-            f.write(f"# 🎬 Engaging Clips with Artistic Titles\n\n")
-            f.write(f"**Artistic Style**: {title_style}\n")
-            f.write(f"**Total Clips**: {len(processed_clips)}\n\n")
-            
-            f.write("## 🎨 Artistic Style\n\n")
-            f.write(f"All clips use the **{title_style}** artistic text effect.\n\n")
-            
-            f.write("## 📝 Clips List\n\n")
-            f.write("| Rank | Title | Filename |\n")
-            f.write("|------|-------|----------|\n")
-            
-            for clip in processed_clips:
-                f.write(f"| {clip['rank']} | {clip['title']} | `{clip['filename']}` |\n")
+        parts = []
+        parts.append(f"# 🎬 Engaging Clips with Artistic Titles\n\n")
+        parts.append(f"**Artistic Style**: {title_style}\n")
+        parts.append(f"**Total Clips**: {len(processed_clips)}\n\n")
+        
+        parts.append("## 🎨 Artistic Style\n\n")
+        parts.append(f"All clips use the **{title_style}** artistic text effect.\n\n")
+        
+        parts.append("## 📝 Clips List\n\n")
+        parts.append("| Rank | Title | Filename |\n")
+        parts.append("|------|-------|----------|\n")
+        
+        for clip in processed_clips:
+            parts.append(f"| {clip['rank']} | {clip['title']} | `{clip['filename']}` |\n")
+        
+        readme_path.write_text(''.join(parts), encoding='utf-8')
         
         logger.info(f"📄 README created: {readme_path}")
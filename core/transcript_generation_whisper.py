@@ -9,9 +9,12 @@ import sys
 import os
 import asyncio
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, List, Callable, Any
-from core.config import WHISPER_MODEL
+from typing import Optional, Dict, List, Callable, Any, Tuple
+from core.config import WHISPER_MODEL, WHISPER_BACKEND, WHISPER_DEVICE, WHISPER_COMPUTE_TYPE, WHISPER_AUTO_COMPUTE_TYPES, WHISPER_CPU_COMPUTE_FALLBACKS, WHISPER_VAD, WHISPER_BATCH_SIZE, WHISPER_WORKERS
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +72,60 @@ def run_whisper_cli(file_path, model_name=WHISPER_MODEL, language=None, output_f
         print("❌ Whisper CLI not found. Make sure it's installed and in your PATH.")
         return False
 
+def _format_srt_timestamp(seconds: float) -> str:
+    """Format seconds as an SRT timestamp (HH:MM:SS,mmm)"""
+    millis = int(round(seconds * 1000))
+    hours, millis = divmod(millis, 3_600_000)
+    minutes, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+
+
+def run_faster_whisper(model, file_path, language=None, output_dir=None, vad_filter=False, batch_size=0, audio=None,
+                       condition_on_previous_text=True):
+    """
+    Transcribe audio/video file with an already loaded faster-whisper model
+    and write {stem}.srt next to it (or into output_dir), like the CLI does
+
+    Args:
+        model: faster_whisper.WhisperModel instance
+        file_path (str): Path to audio/video file
+        language (str): Language code or None for auto-detection
+        output_dir (str): Directory to write the SRT file to
+        vad_filter (bool): Drop non-speech audio with Silero VAD before decoding
+        batch_size (int): Windows decoded per forward pass when model is a BatchedInferencePipeline
+        audio: Already decoded 16 kHz mono waveform of file_path (decoded from the file when None)
+        condition_on_previous_text (bool): Prompt each window with the previous window's text
+
+    Returns:
+        bool: True if successful, False if failed
+    """
+    video_path = Path(file_path)
+    srt_path = Path(output_dir or video_path.parent) / f"{video_path.stem}.srt"
+
+    try:
+        options = {
+            'language': language,
+            'vad_filter': vad_filter,
+            'condition_on_previous_text': condition_on_previous_text
+        }
+        if batch_size > 0:
+            options['batch_size'] = batch_size
+        segments, info = model.transcribe(str(video_path) if audio is None else audio, **options)
+
+        lines = []
+        for index, segment in enumerate(segments, start=1):
+            lines.append(f"{index}\n")
+            lines.append(f"{_format_srt_timestamp(segment.start)} --> {_format_srt_timestamp(segment.end)}\n")
+            lines.append(f"{segment.text.strip()}\n\n")
+
+        srt_path.write_text(''.join(lines), encoding='utf-8')
+        logger.info(f"🎵 Transcribed {video_path.name} ({info.duration:.0f}s audio, language: {info.language})")
+        return True
+    except Exception as e:
+        logger.error(f"❌ faster-whisper failed for {video_path.name}: {e}")
+        return False
+
 def demonstrate_whisper():
     """Demonstrate different Whisper usage examples"""
     
@@ -148,11 +205,155 @@ def simple_transcribe(audio_file, model="base"):
     return run_whisper_cli(audio_file, model_name=model)
 
 
+@lru_cache(maxsize=1)
+def cuda_device_count() -> int:
+    """Number of CUDA devices visible to CTranslate2 (0 when it is not installed)"""
+    try:
+        import ctranslate2
+        return ctranslate2.get_cuda_device_count()
+    except Exception:
+        return 0
+
 class TranscriptProcessor:
     """Handles all transcript-related operations"""
     
-    def __init__(self, whisper_model: str = WHISPER_MODEL):
+    def __init__(self,
+                 whisper_model: str = WHISPER_MODEL,
+                 backend: str = WHISPER_BACKEND,
+                 device: str = WHISPER_DEVICE,
+                 compute_type: str = WHISPER_COMPUTE_TYPE,
+                 workers: int = WHISPER_WORKERS,
+                 vad_filter: bool = WHISPER_VAD,
+                 batch_size: int = WHISPER_BATCH_SIZE):
+        """
+        Args:
+            whisper_model: Whisper model size (tiny, base, small, medium, large, turbo)
+            backend: "openai" to run the whisper CLI, "faster-whisper" for the in-process CTranslate2 backend
+            device: Device for faster-whisper (auto, cpu, cuda)
+            compute_type: Weight precision for faster-whisper (e.g. int8, int8_float16; auto picks per device)
+            workers: Number of video parts transcribed concurrently
+            vad_filter: Skip silence with Silero VAD (faster-whisper backend only)
+            batch_size: Batched decoding size for faster-whisper (0 = sequential decoding; > 0 implies vad_filter)
+        """
         self.whisper_model = whisper_model
+        self.backend = backend
+        self.device = device
+        self.compute_type = compute_type
+        self.workers = max(1, workers)
+        self.vad_filter = vad_filter
+        self.batch_size = max(0, batch_size)
+        if self.batch_size > 0 and not self.vad_filter:
+            # The batched pipeline needs VAD segments to build its windows and
+            # rejects audio longer than 30s without them
+            logger.info("🤖 Batched decoding requires VAD, enabling --whisper-vad")
+            self.vad_filter = True
+        if backend == "faster-whisper" and compute_type in WHISPER_CPU_COMPUTE_FALLBACKS:
+            device, _ = self.resolved_device_and_compute_type()
+            if device == "cpu":
+                # Half precision only runs on GPUs; loading it on CPU fails at model load
+                fallback = WHISPER_CPU_COMPUTE_FALLBACKS[compute_type]
+                logger.warning(f"⚠️  Compute type {compute_type} is not supported on CPU, using {fallback}")
+                self.compute_type = fallback
+        self._faster_whisper_model = None
+        self._model_lock = threading.Lock()
+    
+    def _gpu_count(self) -> int:
+        """GPUs faster-whisper can spread parts across (0 when running on CPU or the CLI backend)"""
+        if self.backend != "faster-whisper" or self.device == "cpu":
+            return 0
+        return cuda_device_count()
+    
+    def resolved_device_and_compute_type(self) -> Tuple[str, str]:
+        """Device and CTranslate2 compute type faster-whisper actually runs with ("auto" resolved)"""
+        device = self.device if self.device != "auto" else ("cuda" if self._gpu_count() else "cpu")
+        compute_type = self.compute_type
+        if compute_type == "auto":
+            compute_type = WHISPER_AUTO_COMPUTE_TYPES.get(device, "default")
+        return device, compute_type
+    
+    def _get_faster_whisper_model(self):
+        """Load the faster-whisper model once and keep it resident (None if unavailable)"""
+        with self._model_lock:
+            if self._faster_whisper_model is None:
+                try:
+                    from faster_whisper import WhisperModel
+                except ImportError:
+                    logger.warning("⚠️  faster-whisper is not installed, falling back to the whisper CLI")
+                    self.backend = "openai"
+                    return None
+                
+                gpu_count = self._gpu_count()
+                device, compute_type = self.resolved_device_and_compute_type()
+                logger.info(f"🤖 Loading faster-whisper model: {self.whisper_model} (device: {device}, compute type: {compute_type})")
+                # With several GPUs, load one replica per device so parallel parts land on different GPUs
+                device_index = list(range(gpu_count)) if gpu_count > 1 else 0
+                if gpu_count > 1:
+                    logger.info(f"🤖 Spreading transcription across {gpu_count} GPUs")
+                # num_workers lets concurrent transcribe() calls share one model in parallel
+                self._faster_whisper_model = WhisperModel(
+                    self.whisper_model,
+                    device=device,
+                    device_index=device_index,
+                    compute_type=compute_type,
+                    num_workers=self.workers
+                )
+                if self.batch_size > 0:
+                    try:
+                        from faster_whisper import BatchedInferencePipeline
+                        self._faster_whisper_model = BatchedInferencePipeline(model=self._faster_whisper_model)
+                        logger.info(f"🤖 Batched decoding enabled (batch size: {self.batch_size})")
+                    except ImportError:
+                        logger.warning("⚠️  Installed faster-whisper has no batched pipeline (needs >= 1.1), decoding sequentially")
+                        self.batch_size = 0
+            return self._faster_whisper_model
+    
+    def warmup(self) -> None:
+        """Load the faster-whisper model ahead of the first transcription (no-op for the CLI backend)"""
+        if self.backend != "faster-whisper":
+            return
+        try:
+            self._get_faster_whisper_model()
+        except Exception as e:
+            logger.warning(f"⚠️  faster-whisper warmup failed, loading on first use instead: {e}")
+    
+    def _decode_audio(self, video_path: Path):
+        """Decode a file to the waveform faster-whisper consumes (None if not applicable)"""
+        if self.backend != "faster-whisper":
+            return None
+        try:
+            from faster_whisper import decode_audio
+            return decode_audio(str(video_path))
+        except ImportError:
+            return None
+        except Exception as e:
+            logger.warning(f"⚠️  Could not pre-decode audio for {video_path.name}, decoding during transcription: {e}")
+            return None
+    
+    def _transcribe_file(self, video_path: Path, audio=None) -> bool:
+        """Transcribe one file to {stem}.srt next to it using the configured backend"""
+        if self.backend == "faster-whisper":
+            model = self._get_faster_whisper_model()
+            if model is not None:
+                return run_faster_whisper(
+                    model,
+                    str(video_path),
+                    language="zh",  # Assuming Chinese content
+                    output_dir=str(video_path.parent),
+                    vad_filter=self.vad_filter,
+                    batch_size=self.batch_size,
+                    audio=audio,
+                    # VAD stitches speech chunks together; carrying text across those
+                    # cuts is what makes Whisper loop on repeated phrases
+                    condition_on_previous_text=not self.vad_filter
+                )
+        
+        return run_whisper_cli(
+            str(video_path),
+            model_name=self.whisper_model,
+            language="zh",  # Assuming Chinese content
+            output_format="srt",
+            output_dir=str(video_path.parent)
+        )
     
     async def process_transcripts(self, 
                                 subtitle_path: str,
@@ -183,37 +384,52 @@ class TranscriptProcessor:
         if isinstance(video_files, str):
             video_files = [video_files]
         
-        transcript_parts = []
         total_files = len(video_files)
+        # Keep every GPU busy even when fewer workers were requested
+        workers = min(max(self.workers, self._gpu_count()), total_files)
+        completed = 0
         
-        for i, video_file in enumerate(video_files):
-            # Update progress
-            if progress_callback:
-                base_progress = 35 + (i / total_files) * 13  # 35-48% range
-                progress_callback(f"Generating transcript {i+1}/{total_files}...", base_progress)
-            
-            logger.info(f"🎙️  Generating transcript for: {Path(video_file).name}")
-            
+        if progress_callback:
+            progress_callback(f"Generating transcript 1/{total_files}...", 35)
+        
+        loop = asyncio.get_event_loop()
+        # Audio of the next part is decoded while the current one is transcribed;
+        # the extra slot bounds how many decoded waveforms are held in memory
+        decode_slots = asyncio.Semaphore(workers + 1)
+        
+        async def transcribe(video_file: str, executor: ThreadPoolExecutor, decoder: ThreadPoolExecutor) -> Optional[str]:
+            nonlocal completed
             video_path = Path(video_file)
             video_dir = video_path.parent
-
-            success = run_whisper_cli(
-                str(video_path),
-                model_name=self.whisper_model,
-                language="zh",  # Assuming Chinese content
-                output_format="srt",
-                output_dir=str(video_dir)
-            )
-
+            
+            async with decode_slots:
+                audio = await loop.run_in_executor(decoder, self._decode_audio, video_path)
+                logger.info(f"🎙️  Generating transcript for: {video_path.name}")
+                success = await loop.run_in_executor(executor, self._transcribe_file, video_path, audio)
+                del audio
+            
+            srt_file = None
             if success:
                 srt_path = video_dir / f"{video_path.stem}.srt"
                 if srt_path.exists():
-                    transcript_parts.append(str(srt_path))
+                    srt_file = str(srt_path)
                     logger.info(f"✅ Generated: {srt_path.name}")
                 else:
                     logger.warning(f"⚠️  SRT file not found for {video_path.name}")
             else:
                 logger.error(f"❌ Whisper failed for {video_path.name}")
+            
+            # Update progress
+            completed += 1
+            if progress_callback and completed < total_files:
+                base_progress = 35 + (completed / total_files) * 13  # 35-48% range
+                progress_callback(f"Generating transcript {completed+1}/{total_files}...", base_progress)
+            return srt_file
+        
+        # Parts are independent; run up to `workers` at once off the event loop
+        with ThreadPoolExecutor(max_workers=workers) as executor, ThreadPoolExecutor(max_workers=1) as decoder:
+            results = await asyncio.gather(*(transcribe(f, executor, decoder) for f in video_files))
+        transcript_parts = [srt_file for srt_file in results if srt_file]
         
         return {
             'source': 'whisper',
@@ -12,10 +12,20 @@ import shutil
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
+from functools import lru_cache
 import logging
 
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is the fallback
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Title sanitization: drop unsafe characters, then collapse whitespace/dash/underscore runs
+_UNSAFE_CHARS_RE = re.compile(r'[^\w\s-]')
+_SEPARATOR_RUNS_RE = re.compile(r'[\s\-_]+')
+
 
 # ============================================================================
 # RESULT CLASSES
@@ -30,6 +40,7 @@ class ProcessingResult:
         self.video_parts = []  # List of video part paths if split
         self.transcript_parts = []  # List of transcript part paths if split
         self.video_info = {}
+        self.safe_video_name = ""  # Filesystem-safe video title, names the per-video output folder
         self.processing_time = 0
         self.transcript_source = ""  # "bilibili" or "whisper"
         self.was_split = False
@@ -39,6 +50,18 @@ class ProcessingResult:
         self.title_addition = {}  # Results from title addition
         self.cover_generation = {}  # Results from cover image generation
 
+    @property
+    def video_dir(self) -> Optional[Path]:
+        """Directory holding the video (or its split parts)"""
+        source = self.video_parts[0] if self.was_split and self.video_parts else self.video_path
+        return Path(source).parent if source else None
+
+    @property
+    def transcript_dir(self) -> Optional[Path]:
+        """Directory holding the transcript (or its split parts)"""
+        source = self.transcript_parts[0] if self.was_split and self.transcript_parts else self.transcript_path
+        return Path(source).parent if source else None
+
 
 class ResultsFormatter:
     """Formats and displays processing results"""
@@ -144,6 +167,9 @@ class ResultsFormatter:
                     print(f"   Generated covers:")
                     for cover in cover_gen['covers']:
                         print(f"     • [{cover.get('rank')}] {cover.get('filename', 'N/A')}")
+            elif cover_gen.get('skipped'):
+                reason = cover_gen.get('reason', 'unknown')
+                print(f"\n🖼️  COVER GENERATION: Skipped - {reason}")
             else:
                 error = cover_gen.get('error', 'Unknown error')
                 print(f"\n🖼️  COVER GENERATION: Failed - {error}")
@@ -266,6 +292,25 @@ class VideoMetadataExtractor:
 class VideoFileManager:
     """Manages video file operations like copying, organizing, and finding files"""
     
+    @staticmethod
+    def link_or_copy(src: Path, dst: Path) -> bool:
+        """
+        Place src at dst without duplicating its bytes when possible
+        
+        Hardlinks when both paths are on the same filesystem; otherwise falls back
+        to shutil.copy2 (which uses the kernel's in-place copy on Linux).
+        
+        Returns:
+            True if dst was hardlinked, False if it was copied
+        """
+        try:
+            os.link(src, dst)
+            return True
+        except OSError:
+            # EXDEV (different filesystem), EPERM (filesystem without hardlinks), ...
+            shutil.copy2(src, dst)
+            return False
+    
     @staticmethod
     def copy_video_to_output(video_path: str, output_dir: Path, video_name: Optional[str] = None) -> Path:
         """Copy video file to output directory"""
@@ -278,9 +323,7 @@ class VideoFileManager:
             video_name = video_file.stem
         
         # Sanitize video name for directory
-        safe_video_name = re.sub(r'[^\w\s-]', '', video_name)
-        safe_video_name = re.sub(r'[\s\-]+', '_', safe_video_name)
-        safe_video_name = re.sub(r'_+', '_', safe_video_name).strip('_')
+        safe_video_name = FileNameSanitizer.safe_name(video_name)
         
         # Create video-specific directory structure
         video_root_dir = output_dir / safe_video_name
@@ -315,9 +358,7 @@ class VideoFileManager:
                     video_name = video_file.stem
                 
                 # Sanitize video name for directory
-                safe_video_name = re.sub(r'[^\w\s-]', '', video_name)
-                safe_video_name = re.sub(r'[\s\-]+', '_', safe_video_name)
-                safe_video_name = re.sub(r'_+', '_', safe_video_name).strip('_')
+                safe_video_name = FileNameSanitizer.safe_name(video_name)
                 
                 # Copy subtitle to output directory
                 subtitle_dest = output_dir / safe_video_name / "local_videos" / f"{video_file.stem}{ext}"
@@ -442,6 +483,12 @@ class FileNameSanitizer:
             filename = filename[:100]
         
         return filename.strip()
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def safe_name(title: str) -> str:
+        """Turn a video or moment title into a directory/file name (memoized per title)"""
+        return _SEPARATOR_RUNS_RE.sub('_', _UNSAFE_CHARS_RE.sub('', title)).strip('_')
 
 
 class VideoDirectoryProcessor:
@@ -487,6 +534,23 @@ class VideoDirectoryProcessor:
 
 
 # Convenience functions for common operations
+def load_json_file(path: str) -> Any:
+    """Load a UTF-8 JSON file, parsing the raw bytes with orjson when installed"""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_json_file(data: Any, path: str) -> None:
+    """Write indented UTF-8 JSON, serializing with orjson when installed"""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
 async def process_local_video_file(video_path: str, output_dir: Path) -> Dict[str, Any]:
     """Complete local video processing workflow"""
     # Get video information first to get video name
@@ -0,0 +1,58 @@
+"""Tests for the JSON extraction and cleaning helpers used on LLM responses"""
+
+import json
+
+import pytest
+
+from core.engaging_moments_analyzer import EngagingMomentsAnalyzer, _find_json_code_block
+
+
+def test_code_block_is_extracted():
+    response = 'Here you go:\n```json\n{"a": 1}\n```\nDone.'
+    assert _find_json_code_block(response) == '{"a": 1}'
+
+
+def test_code_block_with_fence_inside_string_value():
+    response = '```json\n{"why": "uses ``` fences", "b": [1]}\n```'
+    assert _find_json_code_block(response) == '{"why": "uses ``` fences", "b": [1]}'
+
+
+def test_code_block_skips_non_object_block():
+    response = '```json\n[1, 2]\n```\ntext\n```json\n{"a": 1}\n```'
+    assert _find_json_code_block(response) == '{"a": 1}'
+
+
+def test_missing_code_block_returns_none():
+    assert _find_json_code_block('{"a": 1}') is None
+    assert _find_json_code_block('```json\n{"a": 1}') is None
+
+
+@pytest.fixture
+def analyzer():
+    # Cleaning needs no LLM client, so skip __init__ (and its API key lookup)
+    return EngagingMomentsAnalyzer.__new__(EngagingMomentsAnalyzer)
+
+
+def test_clean_strips_code_fence(analyzer):
+    cleaned = analyzer._clean_json_text('```json\n{"a": 1}\n```')
+    assert json.loads(cleaned) == {"a": 1}
+
+
+def test_clean_drops_trailing_commas(analyzer):
+    cleaned = analyzer._clean_json_text('{"a": [1, 2, ], "b": {"c": 3,\n},\n}')
+    assert json.loads(cleaned) == {"a": [1, 2], "b": {"c": 3}}
+
+
+def test_clean_inserts_missing_commas(analyzer):
+    cleaned = analyzer._clean_json_text('{"a": [{"x": 1} {"x": 2}], "b": [[1] [2]]}')
+    assert json.loads(cleaned) == {"a": [{"x": 1}, {"x": 2}], "b": [[1], [2]]}
+
+
+def test_clean_leaves_brackets_inside_strings(analyzer):
+    text = '{"why": "a,} b,] c} {d ][e", "q": "say \\"hi,}\\""}'
+    assert analyzer._clean_json_text(text) == text
+
+
+def test_clean_trims_srt_milliseconds(analyzer):
+    cleaned = analyzer._clean_json_text('{"start_time": "00:01:02,345", "n": [1,234]}')
+    assert json.loads(cleaned) == {"start_time": "00:01:02", "n": [1, 234]}
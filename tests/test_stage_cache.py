@@ -0,0 +1,54 @@
+"""Tests for the content-addressed stage cache"""
+
+import os
+
+from core.stage_cache import StageCache, file_fingerprint
+
+
+def _transcript_key(path):
+    return StageCache.make_key("transcript", [(str(path), file_fingerprint(str(path)))], "base")
+
+
+def test_put_get_round_trip(tmp_path):
+    cache = StageCache(tmp_path / "cache")
+    value = {'source': 'whisper', 'transcript_parts': ['a_part01.srt'], 'title': '标题'}
+    cache.put("transcript", "k", value)
+    assert cache.get("transcript", "k") == value
+    assert cache.get("analysis", "k") is None
+
+
+def test_changed_input_misses(tmp_path):
+    video = tmp_path / "video.mp4"
+    video.write_bytes(b"first")
+    cache = StageCache(tmp_path / "cache")
+    cache.put("transcript", _transcript_key(video), {'source': 'whisper'})
+    assert cache.get("transcript", _transcript_key(video)) == {'source': 'whisper'}
+
+    video.write_bytes(b"second take")
+    stat = video.stat()
+    os.utime(video, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert cache.get("transcript", _transcript_key(video)) is None
+
+
+def test_settings_are_part_of_the_key():
+    assert StageCache.make_key("transcript", "base") != StageCache.make_key("transcript", "small")
+    assert StageCache.make_key("transcript", "base") == StageCache.make_key("transcript", "base")
+
+
+def test_disabled_cache_never_hits(tmp_path):
+    cache = StageCache(tmp_path / "cache", enabled=False)
+    cache.put("transcript", "k", {'source': 'whisper'})
+    assert cache.get("transcript", "k") is None
+    assert not (tmp_path / "cache").exists()
+
+
+def test_unreadable_entry_is_a_miss(tmp_path):
+    cache = StageCache(tmp_path / "cache")
+    entry = tmp_path / "cache" / "analysis" / "k.json"
+    entry.parent.mkdir(parents=True)
+    entry.write_text("{not json", encoding='utf-8')
+    assert cache.get("analysis", "k") is None
+
+
+def test_missing_file_has_no_fingerprint(tmp_path):
+    assert file_fingerprint(str(tmp_path / "missing.mp4")) is None
@@ -0,0 +1,30 @@
+"""Tests for the shared video utilities"""
+
+import re
+
+import pytest
+
+from core.video_utils import FileNameSanitizer
+
+
+def _three_pass_safe_name(title):
+    """The sanitizer safe_name replaced (previously inlined in video_orchestrator)"""
+    name = re.sub(r'[^\w\s-]', '', title)
+    name = re.sub(r'[\s\-]+', '_', name)
+    return re.sub(r'_+', '_', name).strip('_')
+
+
+@pytest.mark.parametrize("title", [
+    "Simple Title",
+    "  leading and trailing  ",
+    "a - b -- c",
+    "under__scores_ and - mixed\t\nwhitespace",
+    "_-_edge_-_",
+    "标题：精彩时刻！第1集",
+    "Emoji 🎬 and symbols <>:\"/\\|?*",
+    "",
+    "---",
+    "café naïve",
+])
+def test_safe_name_matches_three_pass_sanitizer(title):
+    assert FileNameSanitizer.safe_name(title) == _three_pass_safe_name(title)
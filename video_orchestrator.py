@@ -8,21 +8,28 @@ import sys
 import asyncio
 import argparse
 import logging
-import re
 from pathlib import Path
-from typing import Optional, Callable, Dict, Any, Tuple, List
-from datetime import datetime
+from typing import Optional, Callable, Dict, Any, Tuple, List, TYPE_CHECKING
+import time
+from functools import cached_property
 import os
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Import our components from core package
-from core.downloaders import VideoDownloader, DownloadProcessor
 from core.video_splitter import VideoSplitter
 from core.transcript_generation_whisper import TranscriptProcessor
-from core.engaging_moments_analyzer import EngagingMomentsAnalyzer
-from core.clip_generator import ClipGenerator
-from core.title_adder import TitleAdder, TITLE_FONT_SIZES
-from core.cover_image_generator import CoverImageGenerator, COVER_COLORS
+from core.clip_generator import ClipGenerator, clip_frame_path
+from core.stage_cache import StageCache, file_fingerprint
+
+# Downloading (yt-dlp), LLM analysis (requests) and title/cover rendering
+# (MoviePy/PIL/numpy) are imported on first use so --help, bad flags, local
+# files and runs that skip those steps do not pay for them
+if TYPE_CHECKING:
+    from core.downloaders import VideoDownloader, DownloadProcessor
+    from core.title_adder import TitleAdder
+    from core.cover_image_generator import CoverImageGenerator
 
 # Import our utilities (including processing result classes)
 from core.video_utils import (
@@ -30,14 +37,55 @@ from core.video_utils import (
     process_local_video_file,
     ProcessingResult,
     ResultsFormatter,
-    find_existing_download
+    find_existing_download,
+    load_json_file,
+    write_json_file,
+    FileNameSanitizer,
+    VideoFileManager
 )
-from core.config import DEFAULT_LLM_PROVIDER, DEFAULT_TITLE_STYLE, API_KEY_ENV_VARS, MAX_DURATION_MINUTES, WHISPER_MODEL, MAX_CLIPS, SKIP_DOWNLOAD, SKIP_TRANSCRIPT
+from core.config import LLM_CONFIG, DEFAULT_LLM_PROVIDER, DEFAULT_TITLE_STYLE, API_KEY_ENV_VARS, MAX_DURATION_MINUTES, WHISPER_MODEL, MAX_CLIPS, SKIP_DOWNLOAD, SKIP_TRANSCRIPT, STAGE_CACHE_ENABLED, TITLE_FONT_SIZES, COVER_COLORS, LLM_MAX_CONCURRENCY, CLIP_WORKERS, COVER_WORKERS, COVER_JPEG_QUALITY, CLIP_STREAM_COPY, WHISPER_BACKEND, WHISPER_DEVICE, WHISPER_COMPUTE_TYPE, WHISPER_PRECISION_COMPUTE_TYPES, WHISPER_VAD, WHISPER_BATCH_SIZE, WHISPER_WORKERS
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between forwarded progress updates with the same status
+# (0%, 100% and status changes always go through)
+PROGRESS_MIN_INTERVAL = 0.1
+
+# Cover generation result when the analysis found no engaging moments
+_NO_MOMENTS_SKIPPED = {'success': False, 'skipped': True, 'reason': 'no_moments'}
+
+# CLI choices for the preset dictionaries, built once at import
+_TITLE_FONT_CHOICES = tuple(TITLE_FONT_SIZES)
+_COVER_COLOR_CHOICES = tuple(COVER_COLORS)
+_COVER_COLORS_BY_NAME = {name.lower(): rgb for name, rgb in COVER_COLORS.items()}
+
+
+def _throttle_progress(progress_callback: Optional[Callable[[str, float], None]]) -> Optional[Callable[[str, float], None]]:
+    """Wrap a progress callback so bursts of same-status updates reach it at most ~10 times per second"""
+    if progress_callback is None:
+        return None
+    
+    lock = threading.Lock()
+    last_emit = 0.0
+    last_status = None
+    
+    def throttled(status: str, progress: float):
+        nonlocal last_emit, last_status
+        with lock:
+            now = time.monotonic()
+            # A new status always goes through so the UI never shows a stale stage
+            if (progress not in (0, 100) and status == last_status
+                    and now - last_emit < PROGRESS_MIN_INTERVAL):
+                return
+            last_emit = now
+            last_status = status
+        # Called outside the lock: the callback may raise to cancel processing
+        progress_callback(status, progress)
+    
+    return throttled
+
 
 class VideoOrchestrator:
     """
@@ -48,9 +96,16 @@ class VideoOrchestrator:
                 output_dir: str = "processed_videos",
                 max_duration_minutes: float = MAX_DURATION_MINUTES,
                 whisper_model: str = WHISPER_MODEL,
+                whisper_backend: str = WHISPER_BACKEND,
+                whisper_device: str = WHISPER_DEVICE,
+                whisper_compute_type: str = WHISPER_COMPUTE_TYPE,
+                whisper_workers: int = WHISPER_WORKERS,
+                whisper_vad: bool = WHISPER_VAD,
+                whisper_batch_size: int = WHISPER_BATCH_SIZE,
                 browser: str = "firefox",
                 api_key: Optional[str] = None,
                 llm_provider: str = DEFAULT_LLM_PROVIDER,
+                llm_concurrency: int = LLM_MAX_CONCURRENCY,
                 skip_analysis: bool = False,
                 generate_clips: bool = True,
                 add_titles: bool = True,
@@ -64,7 +119,13 @@ class VideoOrchestrator:
                 max_clips: int = MAX_CLIPS,
                 cover_text_location: str = "center",
                 cover_fill_color: str = "yellow",
-                cover_outline_color: str = "black"):
+                cover_outline_color: str = "black",
+                use_cache: bool = STAGE_CACHE_ENABLED,
+                cache_dir: Optional[str] = None,
+                clip_workers: int = CLIP_WORKERS,
+                cover_workers: int = COVER_WORKERS,
+                clip_stream_copy: bool = CLIP_STREAM_COPY,
+                cover_quality: int = COVER_JPEG_QUALITY):
         """
         Initialize the video orchestrator
 
@@ -72,9 +133,16 @@ class VideoOrchestrator:
             output_dir: Directory for all processed outputs
             max_duration_minutes: Maximum duration before splitting (default 20 minutes)
             whisper_model: Whisper model to use for transcript generation
+            whisper_backend: Whisper backend ("openai" CLI or "faster-whisper")
+            whisper_device: Device for the faster-whisper backend (auto, cpu, cuda)
+            whisper_compute_type: Weight precision for the faster-whisper backend (int8, int8_float16, ...)
+            whisper_workers: Number of split parts transcribed concurrently
+            whisper_vad: Skip silent audio with Silero VAD (faster-whisper backend only)
+            whisper_batch_size: Batched decoding size for the faster-whisper backend (0 disables batching)
             browser: Browser for cookie extraction
             api_key: API key for the selected LLM provider
             llm_provider: LLM provider to use ("qwen" or "openrouter", default: from config.py)
+            llm_concurrency: Maximum number of part analysis requests in flight at once
             skip_analysis: Skip engaging moments analysis (clips can still use existing analysis file)
             generate_clips: Whether to generate clips from engaging moments
             add_titles: Whether to add artistic titles to clips
@@ -88,6 +156,12 @@ class VideoOrchestrator:
             cover_text_location: Text position on cover images (default: "center"). Options: "top", "upper_middle", "bottom", "center"
             cover_fill_color: Color name for cover text fill (default: "yellow"). Options: yellow, red, white, cyan, green, orange, pink, purple, gold, silver
             cover_outline_color: Color name for cover text outline (default: "black"). Options: yellow, red, white, cyan, green, orange, pink, purple, gold, silver, black
+            use_cache: Reuse transcript and analysis results from earlier runs with identical inputs
+            cache_dir: Directory for cached stage results (default: <output_dir>/.cache)
+            clip_workers: Number of ffmpeg clip extractions run in parallel
+            cover_workers: Number of cover images rendered in parallel
+            clip_stream_copy: Cut clips with stream copy instead of re-encoding (keyframe-aligned starts)
+            cover_quality: JPEG quality for cover images (1-95)
         """
 
 
@@ -96,27 +170,41 @@ class VideoOrchestrator:
         self.language = language
         self.debug = debug
         self.llm_provider = llm_provider.lower()
+        self.llm_concurrency = max(1, llm_concurrency)
         self.custom_prompt_file = custom_prompt_file
         self.use_background = use_background
         self.title_font_size = TITLE_FONT_SIZES.get(title_font_size, 40)
         self.cover_text_location = cover_text_location
         self.cover_fill_color = cover_fill_color
         self.cover_outline_color = cover_outline_color
+        self.clip_workers = max(1, clip_workers)
+        self.cover_workers = max(1, cover_workers)
+        self.clip_stream_copy = clip_stream_copy
+        self.cover_quality = cover_quality
 
         # Initialize processing components
         # Note: Downloader and splitter will be configured per-video later
-        self.downloader = VideoDownloader(
-            output_dir=str(self.output_dir),
-            browser=browser
-        )
+        self.browser = browser
         self.video_splitter = VideoSplitter(max_duration_minutes, self.output_dir)
-        self.transcript_processor = TranscriptProcessor(whisper_model)
-        self.download_processor = DownloadProcessor(self.downloader)
+        self.transcript_processor = TranscriptProcessor(
+            whisper_model,
+            backend=whisper_backend,
+            device=whisper_device,
+            compute_type=whisper_compute_type,
+            workers=whisper_workers,
+            vad_filter=whisper_vad,
+            batch_size=whisper_batch_size
+        )
+        self.stage_cache = StageCache(
+            Path(cache_dir).expanduser() if cache_dir else self.output_dir / ".cache",
+            enabled=use_cache
+        )
         
         # Initialize engaging moments analyzer only if not skipping and API key is available
         self.skip_analysis = skip_analysis
         self.engaging_moments_analyzer = None
         if not skip_analysis and api_key:
+            from core.engaging_moments_analyzer import EngagingMomentsAnalyzer
             try:
                 self.engaging_moments_analyzer = EngagingMomentsAnalyzer(
                     api_key=api_key,
@@ -146,35 +234,70 @@ class VideoOrchestrator:
         self.clips_dir = None
         self.clips_with_titles_dir = None
         
+        # Clip, title and cover components are built on first use (see the
+        # cached properties below), so runs that stop early never pay for them
         if self.generate_clips_enabled:
-            # Initialize with temporary dir, will be updated later
-            self.clip_generator = ClipGenerator(output_dir=str(self.output_dir))
             logger.info(f"🎬 Clip generation: enabled")
         else:
-            self.clip_generator = None
             logger.info("🎬 Clip generation: disabled")
         
         if self.add_titles_enabled:
-            # Initialize with temporary dir, will be updated later
-            self.title_adder = TitleAdder(output_dir=str(self.output_dir))
             logger.info(f"🎨 Title adding: enabled (style: {title_style})")
         else:
-            self.title_adder = None
             logger.info("🎨 Title adding: disabled")
         
         # Initialize cover image generator
         self.generate_cover_enabled = generate_cover
         if self.generate_cover_enabled:
-            self.cover_generator = CoverImageGenerator()
             logger.info(f"🖼️  Cover generation: enabled (text location: {cover_text_location})")
         else:
-            self.cover_generator = None
             logger.info("🖼️  Cover generation: disabled")
         
         logger.info(f"🎬 Video Orchestrator initialized")
         logger.info(f"📁 Output directory: {self.output_dir}")
         logger.info(f"⏱️  Max duration: {max_duration_minutes} minutes")
-        logger.info(f"🤖 Whisper model: {whisper_model}")
+        logger.info(f"🤖 Whisper model: {whisper_model} (backend: {whisper_backend})")
+    
+    @cached_property
+    def downloader(self) -> "VideoDownloader":
+        """Platform downloader (only built when a URL has to be resolved)"""
+        from core.downloaders import VideoDownloader
+        return VideoDownloader(output_dir=str(self.output_dir), browser=self.browser)
+    
+    @cached_property
+    def download_processor(self) -> "DownloadProcessor":
+        """Download workflow wrapper around the downloader"""
+        from core.downloaders import DownloadProcessor
+        return DownloadProcessor(self.downloader)
+    
+    @cached_property
+    def clip_generator(self) -> Optional[ClipGenerator]:
+        """Clip generator (None when clip generation is disabled)"""
+        if not self.generate_clips_enabled:
+            return None
+        # Initialize with temporary dir, will be updated later
+        return ClipGenerator(
+            output_dir=str(self.output_dir),
+            max_workers=self.clip_workers,
+            stream_copy=self.clip_stream_copy
+        )
+    
+    @cached_property
+    def title_adder(self) -> Optional["TitleAdder"]:
+        """Title adder (None when title adding is disabled)"""
+        if not self.add_titles_enabled:
+            return None
+        from core.title_adder import TitleAdder
+        # Initialize with temporary dir, will be updated later
+        return TitleAdder(output_dir=str(self.output_dir))
+    
+    @cached_property
+    def cover_generator(self) -> Optional["CoverImageGenerator"]:
+        """Cover image generator (None when cover generation is disabled)"""
+        if not self.generate_cover_enabled:
+            return None
+        from core.cover_image_generator import CoverImageGenerator
+        return CoverImageGenerator(jpeg_quality=self.cover_quality)
     
     async def process_video(self,
                           source: str,
@@ -198,14 +321,19 @@ class VideoOrchestrator:
             ProcessingResult object with all processing information
         """
         result = ProcessingResult()
-        start_time = datetime.now()
+        start_time = time.perf_counter()
+        progress_callback = _throttle_progress(progress_callback)
         
         try:
             if progress_callback:
                 progress_callback("Starting video processing...", 0)
             
+            # Whisper is certain to run when forced, so load its model while the
+            # video downloads; transcription waits on the model lock if it is not ready
+            whisper_warmup = self._start_whisper_warmup() if force_whisper and not skip_transcript else None
+            
             # Check if source is a local file or URL
-            is_local_file = await self._is_local_video_file(source)
+            is_local_file = VideoFileValidator.is_local_video_file(source)
             
             if is_local_file:
                 # Step 1: Process local video file
@@ -238,20 +366,26 @@ class VideoOrchestrator:
                     result.video_info = download_result['video_info']
                     subtitle_path = download_result['subtitle_path']
 
+            # Without platform subtitles Whisper will run too; warm it up behind
+            # the duration check and splitting
+            if whisper_warmup is None and not skip_transcript and not subtitle_path:
+                whisper_warmup = self._start_whisper_warmup()
+            
             # Compute video_root_dir from video info for use throughout the pipeline
-            video_name = result.video_info.get('title', 'video')
-            safe_video_name = re.sub(r'[^\w\s-]', '', video_name)
-            safe_video_name = re.sub(r'[\s\-]+', '_', safe_video_name)
-            safe_video_name = re.sub(r'_+', '_', safe_video_name).strip('_')
-            video_root_dir = self.output_dir / safe_video_name
-            video_root_dir.mkdir(parents=True, exist_ok=True)
+            result.safe_video_name = FileNameSanitizer.safe_name(result.video_info.get('title', 'video'))
+            video_root_dir = self.output_dir / result.safe_video_name
+            splits_dir = video_root_dir / "splits"
+            video_clips_dir = video_root_dir / "clips"
+            video_clips_with_titles_dir = video_root_dir / "clips_with_titles"
+            
+            # Create the whole per-video layout up front so a permission or disk
+            # error surfaces before any splitting, transcription or LLM work
+            for directory in (splits_dir, video_clips_dir, video_clips_with_titles_dir):
+                directory.mkdir(parents=True, exist_ok=True)
             
             # Step 2: Check duration and split if needed
             logger.info("⏱️  Step 2: Checking video duration...")
             needs_splitting = self.video_splitter.check_duration_needs_splitting(result.video_info)
-            
-            splits_dir = video_root_dir / "splits"
-            splits_dir.mkdir(parents=True, exist_ok=True)
 
             if needs_splitting:
                 logger.info(f"🔧 Video duration > 20 minutes, splitting required")
@@ -271,8 +405,8 @@ class VideoOrchestrator:
                 splits_video_name = f"{video_file.stem}_part01{video_file.suffix}"
                 splits_video = splits_dir / splits_video_name
                 if not splits_video.exists():
-                    shutil.copy2(str(video_file), str(splits_video))
-                    logger.info(f"📁 Copied video to splits dir as part01: {splits_video.name}")
+                    linked = VideoFileManager.link_or_copy(video_file, splits_video)
+                    logger.info(f"📁 {'Linked' if linked else 'Copied'} video to splits dir as part01: {splits_video.name}")
                 # Set was_split to True and add to video_parts
                 result.was_split = True
                 result.video_parts = [str(splits_video)]
@@ -284,7 +418,9 @@ class VideoOrchestrator:
                     splits_sub_name = f"{sub_file.stem}_part01{sub_file.suffix}"
                     splits_sub = splits_dir / splits_sub_name
                     if not splits_sub.exists():
-                        shutil.copy2(str(sub_file), str(splits_sub))
+                        # Copied, not hardlinked: Whisper writes its transcript to this
+                        # same path and would otherwise overwrite the downloaded subtitle
+                        shutil.copy2(sub_file, splits_sub)
                         logger.info(f"📁 Copied subtitle to splits dir as part01: {splits_sub.name}")
                     # Add subtitle to transcript_parts
                     if not hasattr(result, 'transcript_parts'):
@@ -305,12 +441,26 @@ class VideoOrchestrator:
                     raise Exception("No existing transcript found. Remove --skip-transcript to generate transcripts.")
             else:
                 logger.info("📝 Step 3: Processing transcripts...")
-                transcript_result = await self.transcript_processor.process_transcripts(
-                    subtitle_path,
-                    result.video_path if not result.was_split else result.video_parts,
-                    force_whisper,
-                    progress_callback
-                )
+                transcript_key = self._transcript_cache_key(result, subtitle_path, force_whisper)
+                transcript_result = self.stage_cache.get("transcript", transcript_key)
+                if transcript_result and not all(
+                    os.path.exists(path) for path in transcript_result.get('transcript_parts', [])
+                ):
+                    transcript_result = None
+                if transcript_result is not None and whisper_warmup is not None:
+                    # Cached transcripts: Whisper will not run, so drop the pending warmup
+                    whisper_warmup.cancel()
+                if transcript_result is None:
+                    transcript_result = await self.transcript_processor.process_transcripts(
+                        subtitle_path,
+                        result.video_path if not result.was_split else result.video_parts,
+                        force_whisper,
+                        progress_callback
+                    )
+                    # Only cache complete results so a part that failed is retried next run
+                    video_files = result.video_parts if result.was_split else [result.video_path]
+                    if len(transcript_result.get('transcript_parts') or []) == len(video_files):
+                        self.stage_cache.put("transcript", transcript_key, transcript_result)
 
                 result.transcript_source = transcript_result['source']
                 # Always use transcript_parts since all videos are now treated as split videos
@@ -324,7 +474,18 @@ class VideoOrchestrator:
             engaging_result = None
             if self.engaging_moments_analyzer and not self.skip_analysis:
                 logger.info("🧠 Step 4: Analyzing engaging moments...")
-                engaging_result = await self._analyze_engaging_moments(result, progress_callback)
+                analysis_key = self._analysis_cache_key(result)
+                engaging_result = self.stage_cache.get("analysis", analysis_key)
+                if engaging_result and not os.path.exists(engaging_result.get('aggregated_file') or ''):
+                    engaging_result = None
+                if engaging_result is None:
+                    engaging_result = await self._analyze_engaging_moments(result, progress_callback)
+                    # LLM errors come back as empty results, so never cache an analysis
+                    # that found no moments or lost a part
+                    top_moments = engaging_result.get('top_moments') or {}
+                    if (top_moments.get('top_engaging_moments')
+                            and engaging_result.get('total_parts_analyzed') == len(result.transcript_parts)):
+                        self.stage_cache.put("analysis", analysis_key, engaging_result)
                 result.engaging_moments_analysis = engaging_result
             elif self.skip_analysis:
                 logger.info("🧠 Step 4: Skipping engaging moments analysis (--skip-analysis)")
@@ -334,42 +495,32 @@ class VideoOrchestrator:
                     result.engaging_moments_analysis = engaging_result
                     logger.info(f"   Found existing analysis: {engaging_result.get('aggregated_file')}")
             
-            # Create video-specific subfolders (needed by clips and cover generation)
-            video_clips_dir = video_root_dir / "clips"
-            video_clips_dir.mkdir(parents=True, exist_ok=True)
-
-            video_clips_with_titles_dir = video_root_dir / "clips_with_titles"
-            video_clips_with_titles_dir.mkdir(parents=True, exist_ok=True)
-
             # Initialize video_titles_dir to video_clips_dir as default (for cover generation)
             video_titles_dir = video_clips_dir
 
+            # Steps 6 and 7 are dispatched to worker threads and awaited together
+            loop = asyncio.get_event_loop()
+            finishing_tasks: Dict[str, 'asyncio.Future[Dict[str, Any]]'] = {}
+            # Set when a progress callback raises to cancel, so the other finishing task stops too
+            finishing_cancelled = threading.Event()
+
             # Step 5: Generate clips from engaging moments (if enabled and analysis available)
             if self.clip_generator and engaging_result and engaging_result.get('aggregated_file'):
                 logger.info("🎬 Step 5: Generating clips from engaging moments...")
                 if progress_callback:
                     progress_callback("Generating video clips...", 70)
 
-                # Determine video directory
-                if result.was_split and result.video_parts:
-                    video_dir = Path(result.video_parts[0]).parent
-                else:
-                    video_dir = Path(result.video_path).parent
-                
-                # Determine subtitle directory
-                subtitle_dir = None
-                if result.was_split and result.transcript_parts:
-                    subtitle_dir = Path(result.transcript_parts[0]).parent
-                elif result.transcript_path:
-                    subtitle_dir = Path(result.transcript_path).parent
+                video_dir = result.video_dir
+                subtitle_dir = result.transcript_dir
                 
-                # Update clip generator output dir
-                self.clip_generator.output_dir = video_clips_dir
-                
-                clip_result = self.clip_generator.generate_clips_from_analysis(
+                # ffmpeg work runs on a worker thread so the event loop stays responsive
+                clip_result = await loop.run_in_executor(
+                    None,
+                    self.clip_generator.generate_clips_from_analysis,
                     engaging_result['aggregated_file'],
                     str(video_dir),
-                    str(subtitle_dir) if subtitle_dir else None
+                    str(subtitle_dir) if subtitle_dir else None,
+                    str(video_clips_dir)
                 )
                 result.clip_generation = clip_result
                 
@@ -381,31 +532,54 @@ class VideoOrchestrator:
                     def title_progress_callback(status: str, title_progress: float):
                         if progress_callback:
                             overall_progress = 80 + (title_progress * 0.1)  # Map 0-100 to 80-90
-                            progress_callback(status, overall_progress)
-                    
-                    # Update title adder output dir
-                    self.title_adder.output_dir = video_clips_with_titles_dir
+                            try:
+                                progress_callback(status, overall_progress)
+                            except Exception:
+                                finishing_cancelled.set()
+                                raise
                     
-                    title_result = self.title_adder.add_titles_to_clips(
-                        clip_result['output_dir'],
-                        engaging_result['aggregated_file'],
-                        self.title_style,
-                        self.title_font_size,
-                        progress_callback=title_progress_callback
+                    # Titles and covers both only read the raw clips, so start titling
+                    # in the background and let it overlap with cover generation
+                    finishing_tasks['title_addition'] = loop.run_in_executor(
+                        None,
+                        lambda: self.title_adder.add_titles_to_clips(
+                            clip_result['output_dir'],
+                            engaging_result['aggregated_file'],
+                            self.title_style,
+                            self.title_font_size,
+                            progress_callback=title_progress_callback,
+                            output_dir=str(video_clips_with_titles_dir)
+                        )
                     )
-                    result.title_addition = title_result
             elif self.clip_generator and not engaging_result:
                 logger.warning("⚠️  Clip generation enabled but no analysis file found")
             
             # Step 7: Generate cover images (if enabled and analysis available)
             if self.cover_generator and engaging_result and engaging_result.get('aggregated_file'):
-                logger.info("🖼️  Step 7: Generating cover images...")
-                if progress_callback:
-                    progress_callback("Generating cover images...", 90)
-                
-                # Pass the video-specific clip directory to cover generation
-                cover_result = self._generate_cover_image(result, engaging_result, video_clips_dir, video_titles_dir)
-                result.cover_generation = cover_result
+                top_moments = engaging_result.get('top_moments')
+                if top_moments is not None and not top_moments.get('top_engaging_moments'):
+                    # Nothing to cover; don't tie up an executor thread for a no-op
+                    logger.info("⏭️  Step 7: No engaging moments, skipping cover generation")
+                    result.cover_generation = _NO_MOMENTS_SKIPPED.copy()
+                else:
+                    logger.info("🖼️  Step 7: Generating cover images...")
+                    if progress_callback:
+                        # Titling reports 80-90 from its thread while covers render,
+                        # so start at the bottom of its range instead of jumping past it
+                        cover_progress = 80 if 'title_addition' in finishing_tasks else 90
+                        progress_callback("Generating cover images...", cover_progress)
+                    
+                    # Pass the video-specific clip directory to cover generation
+                    finishing_tasks['cover_generation'] = loop.run_in_executor(
+                        None, self._generate_cover_image, result, engaging_result, video_clips_dir, video_titles_dir,
+                        finishing_cancelled
+                    )
+            
+            # Wait for title addition and cover generation running side by side
+            if finishing_tasks:
+                finishing_results = await asyncio.gather(*finishing_tasks.values())
+                for field_name, field_result in zip(finishing_tasks, finishing_results):
+                    setattr(result, field_name, field_result)
             
             result.success = True
             
@@ -420,14 +594,86 @@ class VideoOrchestrator:
                 progress_callback(error_msg, 0)
         
         finally:
-            end_time = datetime.now()
-            result.processing_time = (end_time - start_time).total_seconds()
+            result.processing_time = time.perf_counter() - start_time
         
         return result
     
-    async def _is_local_video_file(self, source: str) -> bool:
-        """Check if source is a local video file or URL"""
-        return VideoFileValidator.is_local_video_file(source)
+    def _start_whisper_warmup(self) -> 'asyncio.Future[None]':
+        """
+        Load the Whisper model in the background; failures are logged and it loads on first use
+        
+        The load runs on a daemon thread rather than the default executor: when
+        the transcript stage turns out to be cached the future is cancelled, and
+        an unneeded load must not hold up asyncio.run's executor shutdown on exit.
+        """
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+        
+        def settle(error: Optional[BaseException]):
+            if future.done():  # cancelled on a cache hit
+                return
+            if error is None:
+                future.set_result(None)
+            else:
+                future.set_exception(error)
+        
+        def run():
+            error = None
+            try:
+                self.transcript_processor.warmup()
+            except Exception as e:
+                error = e
+            try:
+                loop.call_soon_threadsafe(settle, error)
+            except RuntimeError:  # loop already closed: the run finished without the model
+                pass
+        
+        def log_failure(done: 'asyncio.Future[None]'):
+            if not done.cancelled() and done.exception():
+                logger.warning(f"⚠️  Whisper warmup failed: {done.exception()}")
+        
+        future.add_done_callback(log_failure)
+        threading.Thread(target=run, name="whisper-warmup", daemon=True).start()
+        return future
+    
+    def _transcript_cache_key(self, result: ProcessingResult, subtitle_path: str, force_whisper: bool) -> str:
+        """Cache key for step 3: the video parts, the source subtitle and the Whisper settings"""
+        video_files = result.video_parts if result.was_split else [result.video_path]
+        return StageCache.make_key(
+            "transcript",
+            # Absolute paths: cached transcript paths point into this output
+            # directory, so a cache shared across output dirs must not cross them
+            [(os.path.abspath(path), file_fingerprint(path)) for path in video_files],
+            file_fingerprint(subtitle_path) if subtitle_path else None,
+            self.transcript_processor.whisper_model,
+            self.transcript_processor.backend,
+            # int8 and float16 weights transcribe differently; the CLI backend has no such setting
+            self.transcript_processor.resolved_device_and_compute_type()[1]
+            if self.transcript_processor.backend == "faster-whisper" else None,
+            self.transcript_processor.vad_filter,
+            self.transcript_processor.batch_size,
+            force_whisper
+        )
+    
+    def _analysis_cache_key(self, result: ProcessingResult) -> str:
+        """Cache key for step 4: the transcripts, the prompt file fingerprints, the LLM model and the analysis settings"""
+        analyzer = self.engaging_moments_analyzer
+        prompt_files = sorted(str(path) for path in analyzer.prompts_dir.rglob("*.md"))
+        if self.custom_prompt_file:
+            prompt_files.append(self.custom_prompt_file)
+        return StageCache.make_key(
+            "analysis",
+            # The cached aggregated_file lives next to the transcripts, so key on their location too
+            [(os.path.abspath(path), file_fingerprint(path)) for path in result.transcript_parts],
+            [(path, file_fingerprint(path)) for path in prompt_files],
+            analyzer.provider,
+            # Model and sampling settings come from LLM_CONFIG; editing them must miss the cache
+            LLM_CONFIG.get(analyzer.provider, {}).get('default_model'),
+            LLM_CONFIG.get(analyzer.provider, {}).get('default_params'),
+            analyzer.language,
+            analyzer.use_background,
+            analyzer.max_clips
+        )
     
     async def _process_local_video(self, 
                                  video_path: str,
@@ -456,9 +702,7 @@ class VideoOrchestrator:
         
         # Create video-specific directory structure
         video_name = video_info.get('title', 'video')
-        safe_video_name = re.sub(r'[^\w\s-]', '', video_name)
-        safe_video_name = re.sub(r'[\s\-]+', '_', safe_video_name)
-        safe_video_name = re.sub(r'_+', '_', safe_video_name).strip('_')
+        safe_video_name = FileNameSanitizer.safe_name(video_name)
         
         video_root_dir = self.output_dir / safe_video_name
         video_root_dir.mkdir(parents=True, exist_ok=True)
@@ -499,8 +743,12 @@ class VideoOrchestrator:
             if result.was_split:
                 # Look for split transcript parts in splits dir
                 splits_dir = video_root_dir / "splits"
-                if splits_dir.exists():
-                    transcript_parts = sorted(str(p) for p in splits_dir.glob("*.srt"))
+                if splits_dir.is_dir():
+                    with os.scandir(splits_dir) as entries:
+                        transcript_parts = sorted(
+                            entry.path for entry in entries
+                            if entry.name.endswith('.srt') and entry.is_file()
+                        )
                     if transcript_parts:
                         logger.info(f"   Found {len(transcript_parts)} existing transcript parts in: {splits_dir}")
                         result.transcript_parts = transcript_parts
@@ -513,11 +761,18 @@ class VideoOrchestrator:
                 logger.warning(f"   No existing transcript parts found in: {splits_dir}")
                 return None
             else:
-                # Look for single transcript file next to the video
+                # Look for single transcript file next to the video: list each
+                # directory once and probe the candidate names in memory
                 for search_dir in [video_path.parent, video_root_dir]:
+                    try:
+                        with os.scandir(search_dir) as entries:
+                            names = {entry.name for entry in entries if entry.is_file()}
+                    except OSError:
+                        continue
                     for ext in ['.srt', '.txt', '.vtt', '.ass']:
-                        candidate = search_dir / f"{video_path.stem}{ext}"
-                        if candidate.exists():
+                        candidate_name = f"{video_path.stem}{ext}"
+                        if candidate_name in names:
+                            candidate = search_dir / candidate_name
                             logger.info(f"   Found existing transcript: {candidate}")
                             return {
                                 'source': 'existing',
@@ -526,13 +781,16 @@ class VideoOrchestrator:
                             }
 
                 # Also search recursively under video_root_dir
-                for srt_file in video_root_dir.rglob("*.srt"):
-                    logger.info(f"   Found existing transcript: {srt_file}")
-                    return {
-                        'source': 'existing',
-                        'transcript_path': str(srt_file),
-                        'transcript_parts': []
-                    }
+                for dirpath, _, filenames in os.walk(video_root_dir):
+                    srt_name = next((name for name in filenames if name.endswith('.srt')), None)
+                    if srt_name:
+                        srt_file = os.path.join(dirpath, srt_name)
+                        logger.info(f"   Found existing transcript: {srt_file}")
+                        return {
+                            'source': 'existing',
+                            'transcript_path': srt_file,
+                            'transcript_parts': []
+                        }
 
                 logger.warning(f"   No existing transcript found for: {video_path.name}")
                 return None
@@ -552,13 +810,9 @@ class VideoOrchestrator:
             Dictionary with analysis file path or None if not found
         """
         try:
-            # Determine where to look for analysis file
-            if result.was_split and result.transcript_parts:
-                # Look in the splits directory
-                search_dir = Path(result.transcript_parts[0]).parent
-            elif result.transcript_path:
-                search_dir = Path(result.transcript_path).parent
-            else:
+            # Look next to the transcripts (the splits directory)
+            search_dir = result.transcript_dir
+            if search_dir is None:
                 return None
             
             # Look for top_engaging_moments.json
@@ -598,29 +852,48 @@ class VideoOrchestrator:
             if progress_callback:
                 progress_callback("Analyzing engaging moments...", 50)
             
-            highlights_files = []
-            
             if result.was_split and result.transcript_parts:
-                # Analyze each part separately
-                logger.info(f"🔍 Analyzing {len(result.transcript_parts)} video parts...")
+                # Analyze parts concurrently; the semaphore caps in-flight LLM requests
+                total_parts = len(result.transcript_parts)
+                logger.info(f"🔍 Analyzing {total_parts} video parts...")
                 
-                for i, transcript_path in enumerate(result.transcript_parts):
-                    part_name = f"part{i+1:02d}"
-                    
-                    # Analyze this part
-                    highlights = await self.engaging_moments_analyzer.analyze_part_for_engaging_moments(
-                        transcript_path, part_name
-                    )
-                    
-                    # Save highlights for this part
-                    transcript_dir = Path(transcript_path).parent
+                transcript_dir = result.transcript_dir
+                semaphore = asyncio.Semaphore(self.llm_concurrency)
+                completed = 0
+                
+                async def analyze_part(index: int, transcript_path: str) -> Optional[str]:
+                    nonlocal completed
+                    part_name = f"part{index+1:02d}"
                     highlights_file = transcript_dir / f"highlights_{part_name}.json"
-                    await self.engaging_moments_analyzer.save_highlights_to_file(highlights, str(highlights_file))
-                    highlights_files.append(str(highlights_file))
                     
+                    # A failed part is dropped instead of discarding the parts that succeeded
+                    try:
+                        async with semaphore:
+                            highlights = await self.engaging_moments_analyzer.analyze_part_for_engaging_moments(
+                                transcript_path, part_name
+                            )
+                        
+                        # Save highlights for this part
+                        await self.engaging_moments_analyzer.save_highlights_to_file(highlights, str(highlights_file))
+                    except Exception as e:
+                        logger.error(f"❌ Failed to analyze {part_name}: {e}")
+                        highlights_file = None
+                    
+                    # Progress is reported outside the try so a cancelling callback still aborts the run
+                    completed += 1
                     if progress_callback:
-                        progress = 50 + (i + 1) * 10 / len(result.transcript_parts)
-                        progress_callback(f"Analyzed part {i+1}/{len(result.transcript_parts)}", progress)
+                        progress = 50 + completed * 10 / total_parts
+                        progress_callback(f"Analyzed part {completed}/{total_parts}", progress)
+                    return str(highlights_file) if highlights_file else None
+                
+                part_results = await asyncio.gather(
+                    *(analyze_part(i, path) for i, path in enumerate(result.transcript_parts))
+                )
+                highlights_files = [path for path in part_results if path]
+                if not highlights_files:
+                    raise RuntimeError("Analysis failed for every video part")
+                if len(highlights_files) < total_parts:
+                    logger.warning(f"⚠️  Aggregating {len(highlights_files)}/{total_parts} analyzed parts")
                 
                 # Aggregate top moments
                 logger.info(f"🔄 Aggregating top {self.engaging_moments_analyzer.max_clips} engaging moments...")
@@ -636,7 +909,7 @@ class VideoOrchestrator:
                     'highlights_files': highlights_files,
                     'aggregated_file': str(aggregated_file),
                     'top_moments': top_moments,
-                    'total_parts_analyzed': len(result.transcript_parts)
+                    'total_parts_analyzed': len(highlights_files)
                 }
             else:
                 logger.warning("No transcript available for engaging moments analysis")
@@ -676,28 +949,24 @@ class VideoOrchestrator:
         Returns:
             Updated ProcessingResult with title_addition and cover_generation set
         """
-        import json
-
         result = phase1_result
+        progress_callback = _throttle_progress(progress_callback)
 
         try:
             if progress_callback:
                 progress_callback("Preparing selected clips...", 0)
 
             # Derive directory paths from phase1_result
-            video_name = result.video_info.get('title', 'video')
-            safe_video_name = re.sub(r'[^\w\s-]', '', video_name)
-            safe_video_name = re.sub(r'[\s\-]+', '_', safe_video_name)
-            safe_video_name = re.sub(r'_+', '_', safe_video_name).strip('_')
-            video_root_dir = self.output_dir / safe_video_name
+            if not result.safe_video_name:
+                result.safe_video_name = FileNameSanitizer.safe_name(result.video_info.get('title', 'video'))
+            video_root_dir = self.output_dir / result.safe_video_name
 
             video_clips_dir = video_root_dir / "clips"
             video_clips_with_titles_dir = video_root_dir / "clips_with_titles"
             video_clips_with_titles_dir.mkdir(parents=True, exist_ok=True)
 
             # Filter analysis file to only include selected ranks
-            with open(engaging_result['aggregated_file'], 'r', encoding='utf-8') as f:
-                analysis_data = json.load(f)
+            analysis_data = load_json_file(engaging_result['aggregated_file'])
 
             analysis_data['top_engaging_moments'] = [
                 m for m in analysis_data['top_engaging_moments']
@@ -705,8 +974,7 @@ class VideoOrchestrator:
             ]
 
             filtered_file = video_root_dir / "selected_engaging_moments.json"
-            with open(str(filtered_file), 'w', encoding='utf-8') as f:
-                json.dump(analysis_data, f, ensure_ascii=False, indent=2)
+            write_json_file(analysis_data, str(filtered_file))
 
             logger.info(f"📋 Phase 2: Processing {len(selected_ranks)} selected clips")
 
@@ -721,13 +989,13 @@ class VideoOrchestrator:
                         overall = 10 + (title_progress * 0.6)  # Map 0-100 to 10-70
                         progress_callback(status, overall)
 
-                self.title_adder.output_dir = video_clips_with_titles_dir
                 title_result = self.title_adder.add_titles_to_clips(
                     str(video_clips_dir),
                     str(filtered_file),
                     self.title_style,
                     self.title_font_size,
-                    progress_callback=title_progress_wrapper
+                    progress_callback=title_progress_wrapper,
+                    output_dir=str(video_clips_with_titles_dir)
                 )
                 result.title_addition = title_result
 
@@ -737,7 +1005,11 @@ class VideoOrchestrator:
                 if progress_callback:
                     progress_callback("Generating cover images...", 75)
 
-                filtered_engaging = {**engaging_result, 'aggregated_file': str(filtered_file)}
+                filtered_engaging = {
+                    **engaging_result,
+                    'aggregated_file': str(filtered_file),
+                    'top_moments': analysis_data
+                }
                 cover_result = self._generate_cover_image(
                     result, filtered_engaging, video_clips_dir, video_clips_dir
                 )
@@ -754,7 +1026,8 @@ class VideoOrchestrator:
         return result
 
     def _generate_cover_image(self, result: ProcessingResult, engaging_result: Dict[str, Any],
-                             clips_dir: Path, covers_output_dir: Path) -> Dict[str, Any]:
+                             clips_dir: Path, covers_output_dir: Path,
+                             cancelled: Optional[threading.Event] = None) -> Dict[str, Any]:
         """
         Generate cover images for each engaging moment with styled text overlay
         
@@ -763,65 +1036,62 @@ class VideoOrchestrator:
             engaging_result: Dictionary with engaging moments analysis
             clips_dir: Directory containing the video clips
             covers_output_dir: Directory to save cover images
+            cancelled: When set (the run was cancelled), covers not yet started are skipped
             
         Returns:
             Dictionary with cover generation results
         """
         try:
-            import json
-            import re
+            # Step 4 keeps the aggregated analysis in memory; only results found
+            # on disk (--skip-analysis) need the file parsed again
+            data = engaging_result.get('top_moments') or load_json_file(engaging_result['aggregated_file'])
             
-            # Load analysis data to get all engaging moments
-            with open(engaging_result['aggregated_file'], 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            moments = data.get('top_engaging_moments')
+            if not moments:
+                logger.info("⏭️  No engaging moments, skipping cover generation")
+                return _NO_MOMENTS_SKIPPED.copy()
             
-            generated_covers = []
+            # One directory listing replaces a stat() per moment
+            with os.scandir(clips_dir) as entries:
+                existing_clips = {entry.name for entry in entries if entry.is_file()}
             
-            # Generate a cover for each engaging moment
-            for moment in data['top_engaging_moments']:
-                rank = moment['rank']
-                moment_title = moment['title']
-                
-                # Find the corresponding clip file
-                safe_moment_title = re.sub(r'[^\w\s-]', '', moment_title)
-                safe_moment_title = re.sub(r'[\s\-]+', '_', safe_moment_title)
-                safe_moment_title = re.sub(r'_+', '_', safe_moment_title).strip('_')
-                
-                # Look for the clip in the video-specific clips directory
-                clip_filename = f"rank_{rank:02d}_{safe_moment_title}.mp4"
-                clip_path = clips_dir / clip_filename
-                
-                if not clip_path.exists():
-                    logger.warning(f"✗ Clip not found for rank {rank}: {clip_filename}")
-                    continue
-                
-                # Generate cover filename
-                cover_filename = f"cover_rank_{rank:02d}_{safe_moment_title}.jpg"
-                cover_path = covers_output_dir / cover_filename
-                
-                logger.info(f"[{rank}] Generating cover from clip: {moment_title}")
-                
-                # Generate cover from first frame of the clip (frame_time=0.0)
-                success = self.cover_generator.generate_cover(
-                    str(clip_path),
-                    moment_title,
-                    str(cover_path),
-                    frame_time=0.0,  # Use first frame of the clip
-                    text_location=self.cover_text_location,
-                    fill_color=self.cover_fill_color,
-                    outline_color=self.cover_outline_color
+            # Clips cut in this run are known by rank, so their names need not be rebuilt
+            clip_files_by_rank = {
+                clip['rank']: clip['filename']
+                for clip in (result.clip_generation or {}).get('clips_info', [])
+            }
+            clip_filenames = {
+                moment['rank']: clip_files_by_rank.get(moment['rank'])
+                or f"rank_{moment['rank']:02d}_{FileNameSanitizer.safe_name(moment['title'])}.mp4"
+                for moment in moments
+            }
+            
+            # Clips from earlier runs have no first-frame image yet; grab all of
+            # them in one ffmpeg run instead of one decode per cover
+            frameless_clips = [
+                clips_dir / name for name in clip_filenames.values()
+                if name in existing_clips and not clip_frame_path(clips_dir / name).exists()
+            ]
+            if len(frameless_clips) > 1:
+                clip_frame_path(frameless_clips[0]).parent.mkdir(parents=True, exist_ok=True)
+                self.cover_generator.extract_first_frames(
+                    [str(path) for path in frameless_clips],
+                    [str(clip_frame_path(path)) for path in frameless_clips]
                 )
-                
-                if success:
-                    generated_covers.append({
-                        'rank': rank,
-                        'title': moment_title,
-                        'filename': cover_filename,
-                        'path': str(cover_path)
-                    })
-                    logger.info(f"✓ Cover saved: {cover_filename}")
-                else:
-                    logger.warning(f"✗ Failed to generate cover for rank {rank}")
+            
+            # Each cover decodes one frame via ffmpeg and renders text with PIL,
+            # both of which release the GIL, so render them on a thread pool
+            workers = max(1, min(self.cover_workers, len(moments)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                cover_results = list(executor.map(
+                    lambda moment: None if cancelled is not None and cancelled.is_set()
+                    else self._generate_moment_cover(
+                        moment, clips_dir, covers_output_dir, existing_clips,
+                        clip_filenames[moment['rank']]
+                    ),
+                    moments
+                ))
+            generated_covers = [cover for cover in cover_results if cover]
             
             if generated_covers:
                 return {
@@ -844,12 +1114,86 @@ class VideoOrchestrator:
             }
 
 
-async def main():
-    """Main async function for command-line interface"""
-    parser = argparse.ArgumentParser(
-        description="Video Processing Orchestrator - Download, split, and generate transcripts",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+    def _generate_moment_cover(self, moment: Dict[str, Any], clips_dir: Path,
+                               covers_output_dir: Path,
+                               existing_clips: Optional[set] = None,
+                               clip_filename: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Generate the cover image for a single engaging moment
+        
+        Args:
+            moment: Engaging moment entry with rank and title
+            clips_dir: Directory containing the video clips
+            covers_output_dir: Directory to save cover images
+            existing_clips: Names of the files in clips_dir (checked on disk when omitted)
+            clip_filename: Name of the clip produced for this moment (derived from the title when omitted)
+            
+        Returns:
+            Cover info dictionary, or None if the cover could not be generated
+        """
+        rank = moment['rank']
+        moment_title = moment['title']
+        
+        # Find the corresponding clip file in the video-specific clips directory
+        if not clip_filename:
+            clip_filename = f"rank_{rank:02d}_{FileNameSanitizer.safe_name(moment_title)}.mp4"
+        clip_path = clips_dir / clip_filename
+        
+        clip_exists = clip_filename in existing_clips if existing_clips is not None else clip_path.exists()
+        if not clip_exists:
+            logger.warning(f"✗ Clip not found for rank {rank}: {clip_filename}")
+            return None
+        
+        # Generate cover filename
+        cover_filename = f"cover_{clip_path.stem}.jpg"
+        cover_path = covers_output_dir / cover_filename
+        
+        logger.info(f"[{rank}] Generating cover from clip: {moment_title}")
+        
+        # Prefer the first frame saved alongside the clip when it was cut;
+        # clips from older runs fall back to decoding the clip itself
+        frame_path = clip_frame_path(clip_path)
+        if frame_path.exists():
+            success = self.cover_generator.generate_cover_from_image(
+                str(frame_path),
+                moment_title,
+                str(cover_path),
+                text_location=self.cover_text_location,
+                fill_color=self.cover_fill_color,
+                outline_color=self.cover_outline_color
+            )
+        else:
+            # Generate cover from first frame of the clip (frame_time=0.0)
+            success = self.cover_generator.generate_cover(
+                str(clip_path),
+                moment_title,
+                str(cover_path),
+                frame_time=0.0,  # Use first frame of the clip
+                text_location=self.cover_text_location,
+                fill_color=self.cover_fill_color,
+                outline_color=self.cover_outline_color
+            )
+        
+        if not success:
+            logger.warning(f"✗ Failed to generate cover for rank {rank}")
+            return None
+        
+        logger.info(f"✓ Cover saved: {cover_filename}")
+        return {
+            'rank': rank,
+            'title': moment_title,
+            'filename': cover_filename,
+            'path': str(cover_path)
+        }
+
+
+def parse_rgb_color(color_name: str, default: Tuple[int, int, int]) -> Tuple[int, int, int]:
+    """Map a cover colour name to its RGB value, or default when the name is unknown"""
+    return _COVER_COLORS_BY_NAME.get(color_name.lower().strip(), default)
+
+
+# Command-line usage examples shown after the argparse help
+_EPILOG = """
 Examples:
   # Basic processing (use platform subtitles if available)
   python video_orchestrator.py "https://www.bilibili.com/video/BV1wT6GBBEPp"
@@ -895,18 +1239,47 @@ Examples:
   python video_orchestrator.py -o "my_outputs" "https://www.bilibili.com/video/BV1234567890"
 
 Note: Set QWEN_API_KEY or OPENROUTER_API_KEY environment variable based on your selected LLM provider
-        """
+"""
+
+
+async def main():
+    """Main async function for command-line interface"""
+    parser = argparse.ArgumentParser(
+        description="Video Processing Orchestrator - Download, split, and generate transcripts",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
     )
     
     parser.add_argument('source', help='Video URL (Bilibili/YouTube) or local video file path')
     parser.add_argument('-o', '--output', default='processed_videos',
                        help='Output directory (default: processed_videos)')
+    parser.add_argument('--whisper-model', default=WHISPER_MODEL,
+                       choices=['tiny', 'base', 'small', 'medium', 'large', 'turbo'],
+                       help=f'Whisper model size for transcript generation (default: {WHISPER_MODEL})')
+    parser.add_argument('--whisper-backend', default=WHISPER_BACKEND,
+                       choices=['openai', 'faster-whisper'],
+                       help=f'Whisper backend: openai (whisper CLI) or faster-whisper (CTranslate2, int8) (default: {WHISPER_BACKEND})')
+    parser.add_argument('--whisper-vad', action='store_true', default=WHISPER_VAD,
+                       help='Skip silent audio with Silero VAD before transcribing (faster-whisper backend only)')
+    parser.add_argument('--precision', default=None,
+                       choices=list(WHISPER_PRECISION_COMPUTE_TYPES.keys()),
+                       help=f'Weight precision for the faster-whisper backend; fp16/bf16 fall back to fp32 on CPU (default: {WHISPER_COMPUTE_TYPE}, i.e. int8 on CPU and int8_float16 on GPU)')
+    parser.add_argument('--whisper-batch-size', type=int, default=WHISPER_BATCH_SIZE,
+                       help='Decode this many audio windows per forward pass with faster-whisper; implies --whisper-vad (0 = off, default: %(default)s)')
     parser.add_argument('--force-whisper', action='store_true',
                        help='Force transcript generation via Whisper (ignore platform subtitles)')
     parser.add_argument('--skip-download', action='store_true', default=SKIP_DOWNLOAD,
                        help='Skip video download and use existing downloaded video')
     parser.add_argument('--skip-transcript', action='store_true', default=SKIP_TRANSCRIPT,
                        help='Skip transcript generation (use existing transcript files)')
+    parser.add_argument('--workers', type=int, default=None,
+                       help=f'Parallel ffmpeg/PIL jobs for clip cutting and cover rendering (default: {CLIP_WORKERS} clips, {COVER_WORKERS} covers)')
+    parser.add_argument('--fast-clips', action='store_true', default=CLIP_STREAM_COPY,
+                       help='Cut clips with stream copy instead of re-encoding (much faster; clips start on the nearest earlier keyframe)')
+    parser.add_argument('--cache-dir', default=None,
+                       help='Directory for cached transcript/analysis results (default: <output>/.cache)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Recompute transcripts and analysis even if cached results exist')
     parser.add_argument('--skip-analysis', action='store_true',
                        help='Skip engaging moments analysis (can still generate clips from existing analysis file)')
     parser.add_argument('--use-background', action='store_true',
@@ -924,8 +1297,8 @@ Note: Set QWEN_API_KEY or OPENROUTER_API_KEY environment variable based on your
                                'fire_flame', 'metallic_silver', 'glowing_plasma', 'stone_carved', 'glass_transparent'],
                        help=f'Visual style for title banner (default: {DEFAULT_TITLE_STYLE})')
     parser.add_argument('--title-font-size', default='medium',
-                       choices=list(TITLE_FONT_SIZES.keys()),
-                       help=f'Font size for artistic titles (default: medium, {TITLE_FONT_SIZES["medium"]}px). Options: {", ".join(TITLE_FONT_SIZES.keys())}')
+                       choices=_TITLE_FONT_CHOICES,
+                       help=f'Font size for artistic titles (default: medium, {TITLE_FONT_SIZES["medium"]}px). Options: {", ".join(_TITLE_FONT_CHOICES)}')
     parser.add_argument('--browser', default='firefox',
                        choices=['chrome', 'firefox', 'edge', 'safari'],
                        help='Browser for cookie extraction (default: firefox)')
@@ -935,15 +1308,17 @@ Note: Set QWEN_API_KEY or OPENROUTER_API_KEY environment variable based on your
     parser.add_argument('--llm-provider', default='qwen',
                        choices=['qwen', 'openrouter'],
                        help='LLM provider to use for engaging moments analysis (default: qwen)')
+    parser.add_argument('--llm-concurrency', type=int, default=LLM_MAX_CONCURRENCY,
+                       help=f'Maximum concurrent LLM requests when analyzing split parts (default: {LLM_MAX_CONCURRENCY})')
     parser.add_argument('--cover-text-location', default='center',
                        choices=['top', 'upper_middle', 'bottom', 'center'],
                        help='Text position on cover images (default: center)')
     parser.add_argument('--cover-fill-color', default='yellow',
-                       choices=list(COVER_COLORS.keys()),
-                       help=f'Cover text fill color (default: yellow). Options: {", ".join(COVER_COLORS.keys())}')
+                       choices=_COVER_COLOR_CHOICES,
+                       help=f'Cover text fill color (default: yellow). Options: {", ".join(_COVER_COLOR_CHOICES)}')
     parser.add_argument('--cover-outline-color', default='black',
-                       choices=list(COVER_COLORS.keys()),
-                       help=f'Cover text outline color (default: black). Options: {", ".join(COVER_COLORS.keys())}')
+                       choices=_COVER_COLOR_CHOICES,
+                       help=f'Cover text outline color (default: black). Options: {", ".join(_COVER_COLOR_CHOICES)}')
     parser.add_argument('-f', '--filename',
                        help='Custom filename template')
     parser.add_argument('-v', '--verbose', action='store_true',
@@ -951,17 +1326,12 @@ Note: Set QWEN_API_KEY or OPENROUTER_API_KEY environment variable based on your
     parser.add_argument('--debug', action='store_true',
                        help='Enable debug mode to export full prompts sent to LLM')
     args = parser.parse_args()
+    if args.precision and args.whisper_backend != 'faster-whisper':
+        parser.error("--precision only applies to --whisper-backend faster-whisper")
 
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    def parse_rgb_color(color_name: str) -> Tuple[int, int, int]:
-        color_name = color_name.lower().strip()
-        if color_name not in COVER_COLORS:
-            logger.warning(f"Unknown color '{color_name}', using default. Available colors: {', '.join(COVER_COLORS.keys())}")
-            return (255, 220, 0) if 'fill' in color_name or 'yellow' in color_name else (0, 0, 0)
-        return COVER_COLORS[color_name]
-
     # Get API key from environment
     api_key = os.getenv(API_KEY_ENV_VARS.get(args.llm_provider, "QWEN_API_KEY"))
 
@@ -969,10 +1339,15 @@ Note: Set QWEN_API_KEY or OPENROUTER_API_KEY environment variable based on your
     orchestrator = VideoOrchestrator(
         output_dir=args.output,
         max_duration_minutes=MAX_DURATION_MINUTES,
-        whisper_model=WHISPER_MODEL,
+        whisper_model=args.whisper_model,
+        whisper_backend=args.whisper_backend,
+        whisper_vad=args.whisper_vad,
+        whisper_batch_size=args.whisper_batch_size,
+        whisper_compute_type=WHISPER_PRECISION_COMPUTE_TYPES.get(args.precision, WHISPER_COMPUTE_TYPE),
         browser=args.browser,
         api_key=api_key,
         llm_provider=args.llm_provider,
+        llm_concurrency=args.llm_concurrency,
         skip_analysis=args.skip_analysis,
         generate_clips=not args.skip_clips,
         add_titles=not args.skip_titles,
@@ -984,18 +1359,46 @@ Note: Set QWEN_API_KEY or OPENROUTER_API_KEY environment variable based on your
         debug=args.debug,
         max_clips=args.max_clips,
         cover_text_location=args.cover_text_location,
-        cover_fill_color=parse_rgb_color(args.cover_fill_color),
-        cover_outline_color=parse_rgb_color(args.cover_outline_color)
+        cover_fill_color=parse_rgb_color(args.cover_fill_color, COVER_COLORS["yellow"]),
+        cover_outline_color=parse_rgb_color(args.cover_outline_color, COVER_COLORS["black"]),
+        use_cache=STAGE_CACHE_ENABLED and not args.no_cache,
+        cache_dir=args.cache_dir,
+        clip_workers=args.workers or CLIP_WORKERS,
+        cover_workers=args.workers or COVER_WORKERS,
+        clip_stream_copy=args.fast_clips
     )
     
+    # Coalesce progress updates: redraw the status line at most every 50 ms unless
+    # the message changes; when stdout is not a terminal print 10% milestones only.
+    # Writes go through a single writer thread so a slow terminal or pipe never
+    # blocks the event loop (or the worker threads that also report progress)
+    is_tty = sys.stdout.isatty()
+    progress_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="progress")
+    progress_lock = threading.Lock()
+    last_status = None
+    last_progress = -1.0
+    last_write = 0.0
+    
     def progress_callback(status: str, progress: float):
-        print(f"\r🔄 {status} ({progress:.1f}%)", end='', flush=True)
+        nonlocal last_status, last_progress, last_write
+        with progress_lock:
+            now = time.monotonic()
+            if is_tty:
+                if (status == last_status and progress < 100
+                        and now - last_write < 0.05 and abs(progress - last_progress) < 0.5):
+                    return
+                progress_writer.submit(print, f"\r🔄 {status} ({progress:.1f}%)", end='', flush=True)
+            else:
+                if int(progress // 10) == int(last_progress // 10):
+                    return
+                progress_writer.submit(print, f"🔄 {status} ({progress:.1f}%)", flush=True)
+            last_status, last_progress, last_write = status, progress, now
+    
+    print(f"🚀 Starting video processing...")
+    print(f"🔗 Source: {args.source}")
     
+    # Process video
     try:
-        print(f"🚀 Starting video processing...")
-        print(f"🔗 Source: {args.source}")
-        
-        # Process video
         result = await orchestrator.process_video(
             args.source,
             force_whisper=args.force_whisper,
@@ -1004,26 +1407,37 @@ Note: Set QWEN_API_KEY or OPENROUTER_API_KEY environment variable based on your
             skip_transcript=args.skip_transcript,
             progress_callback=progress_callback
         )
-        
-        print()  # New line after progress
-        
-        # Print results using the ResultsFormatter
-        ResultsFormatter.print_results(result)
-        
-        return 0 if result.success else 1
-    
-    except KeyboardInterrupt:
-        print("\n❌ Processing interrupted by user")
-        return 1
     except Exception as e:
-        print(f"\n❌ Unexpected error: {str(e)}")
+        if args.debug:
+            logger.exception("❌ Unexpected error")
+        else:
+            print(f"\n❌ Unexpected error: {str(e)} (rerun with --debug for the traceback)")
         return 1
+    finally:
+        # Let pending progress lines land before printing anything else
+        progress_writer.shutdown(wait=True)
+    
+    print()  # New line after progress
+    
+    # Print results using the ResultsFormatter
+    ResultsFormatter.print_results(result)
+    
+    return 0 if result.success else 1
 
 
 if __name__ == "__main__":
+    # Use the libuv-based event loop when installed (not available on Windows,
+    # where asyncio's default proactor loop is kept). uvloop.run replaces the
+    # deprecated uvloop.install(), which warns on Python 3.12+
+    try:
+        import uvloop
+        run_async = uvloop.run
+    except ImportError:
+        run_async = asyncio.run
+    
     # Run async main
     try:
-        exit_code = asyncio.run(main())
+        exit_code = run_async(main())
         sys.exit(exit_code)
     except KeyboardInterrupt:
         print("\n❌ Interrupted by user")